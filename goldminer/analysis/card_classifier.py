@@ -7,10 +7,86 @@ in both English and Arabic, and looking up associated account metadata.
 import re
 import yaml
 import os
+from functools import lru_cache
 from typing import Dict, Optional, Any
 from pathlib import Path
 from goldminer.utils import setup_logger
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+try:
+    import re2  # Optional: google-re2 gives linear-time (DFA) matching
+except ImportError:
+    re2 = None
+
+
+# Translation table for Arabic-Indic (U+0660-U+0669) and Extended Arabic-Indic
+# (U+06F0-U+06F9) to Western numerals, built once so conversion is a single
+# str.translate call
+_ARABIC_INDIC_TABLE = str.maketrans({
+    **{chr(0x0660 + i): chr(0x30 + i) for i in range(10)},
+    **{chr(0x06F0 + i): chr(0x30 + i) for i in range(10)},
+})
+
+# Card suffix patterns in priority order. Each captures the suffix in a group
+# named s<priority>; the lookahead ensures exactly 4 digits are captured.
+# Digits are normalized before matching, so the patterns only need ASCII [0-9].
+_CARD_SUFFIX_PATTERNS = (
+    # English patterns - various ways to indicate card suffix
+    r'(?:ending|card ending|ends with)\s+(?P<s0>[0-9]{4})(?![0-9])',  # "ending 1234", "card ending 1234"
+    r'(?:card|Card)\s+(?:number\s+)?(?:\*+\s*)?(?P<s1>[0-9]{4})(?![0-9])',  # "card 1234", "Card **1234"
+    r'\*+(?P<s2>[0-9]{4})(?![0-9])',  # "**1234", "****1234"
+    # Arabic patterns - various ways to indicate card suffix
+    r'(?:رقم|بطاقة رقم|ينتهي)\s+(?P<s3>[0-9]{4})(?![0-9])',  # "رقم 1234", "بطاقة رقم 1234"
+    r'(?:بطاقة)\s+(?:\*+\s*)?(?P<s4>[0-9]{4})(?![0-9])',  # "بطاقة 1234", "بطاقة **1234"
+)
+
+# Literals at least one of which appears in any SMS a suffix pattern can match
+# ("end" covers "ending" and "ends with"); checked against the casefolded text
+_CARD_SUFFIX_TRIGGERS = ('end', 'card', '*', 'رقم', 'ينتهي', 'بطاقة')
+
+
+def _compile_card_suffix_regex():
+    """
+    Fuse all card suffix patterns into one alternation scanned in a single pass.
+    
+    The alternation sits inside a lookahead so matches are zero-width: every
+    start position is reported, and a lower-priority match can never consume
+    the text of an overlapping higher-priority one.
+    """
+    fused = '|'.join(f'(?:{pattern})' for pattern in _CARD_SUFFIX_PATTERNS)
+    return re.compile(f'(?={fused})', re.IGNORECASE | re.UNICODE)
+
+
+def _compile_card_suffix_re2():
+    """
+    Compile the card suffix patterns with RE2, or return None if unavailable.
+    
+    RE2 has no lookaround, so the patterns are searched one at a time in
+    priority order, and the "exactly 4 digits" lookahead becomes a trailing
+    non-digit or end of text. The whitespace class is spelled out in Unicode
+    terms so it matches what the re module accepts for \\s.
+    """
+    if re2 is None:
+        return None
+    
+    space = r'[\t-\r\x1c-\x1f\x85\p{Z}]'
+    compiled = []
+    for pattern in _CARD_SUFFIX_PATTERNS:
+        pattern = pattern.replace(r'(?![0-9])', r'(?:[^0-9]|$)').replace(r'\s', space)
+        try:
+            compiled.append(re2.compile('(?i)' + pattern))
+        except re2.error:
+            return None
+    return tuple(compiled)
+
+
+_CARD_SUFFIX_RE = _compile_card_suffix_regex()
+_CARD_SUFFIX_RE2 = _compile_card_suffix_re2()
+
 
 class CardClassifier:
     """
@@ -26,13 +102,19 @@ class CardClassifier:
         logger: Logger instance for tracking operations
     """
     
-    def __init__(self, accounts_file: Optional[str] = None):
+    def __init__(
+        self,
+        accounts_file: Optional[str] = None,
+        accounts: Optional[Dict[str, Dict[str, Any]]] = None
+    ):
         """
         Initialize the CardClassifier.
         
         Args:
             accounts_file: Path to YAML file containing account metadata.
                           If None, uses default 'accounts.yaml' in project root.
+            accounts: Optional dictionary mapping card suffixes to account metadata.
+                     If given, it is validated and used instead of reading accounts_file.
         
         Raises:
             FileNotFoundError: If accounts file doesn't exist
@@ -54,7 +136,11 @@ class CardClassifier:
         self.accounts_file = str(accounts_file)
         
         # Load account metadata
-        self.accounts = self._load_accounts()
+        if accounts is not None:
+            self.accounts = self._validate_accounts(accounts)
+        else:
+            self.accounts = self._load_accounts()
+        self._templates = self._build_templates(self.accounts)
         
         self.logger.info(
             f"CardClassifier initialized with {len(self.accounts)} account records"
@@ -78,25 +164,13 @@ class CardClassifier:
         
         try:
             with open(self.accounts_file, 'r', encoding='utf-8') as f:
-                accounts_data = yaml.safe_load(f)
+                accounts_data = yaml.load(f, Loader=SafeLoader)
             
             if not accounts_data:
                 self.logger.warning("Accounts file is empty")
                 return {}
             
-            if not isinstance(accounts_data, dict):
-                raise ValueError("Accounts file must contain a dictionary")
-            
-            # Validate account structure
-            for suffix, metadata in accounts_data.items():
-                if not isinstance(metadata, dict):
-                    raise ValueError(f"Account metadata for suffix '{suffix}' must be a dictionary")
-                
-                # Ensure required fields exist
-                required_fields = ['account_id', 'account_type']
-                for field in required_fields:
-                    if field not in metadata:
-                        raise ValueError(f"Account '{suffix}' missing required field: {field}")
+            self._validate_accounts(accounts_data)
             
             self.logger.info(f"Loaded {len(accounts_data)} account records from {self.accounts_file}")
             return accounts_data
@@ -108,12 +182,61 @@ class CardClassifier:
             self.logger.error(f"Error loading accounts: {e}")
             raise
     
+    @staticmethod
+    def _validate_accounts(accounts_data: Any) -> Dict[str, Dict[str, Any]]:
+        """
+        Validate the structure of account metadata.
+        
+        Args:
+            accounts_data: Parsed account metadata
+            
+        Returns:
+            The validated account metadata
+            
+        Raises:
+            ValueError: If the metadata is not a dictionary of account records
+                       with the required fields
+        """
+        if not isinstance(accounts_data, dict):
+            raise ValueError("Accounts file must contain a dictionary")
+        
+        # Validate account structure
+        for suffix, metadata in accounts_data.items():
+            if not isinstance(metadata, dict):
+                raise ValueError(f"Account metadata for suffix '{suffix}' must be a dictionary")
+            
+            # Ensure required fields exist
+            required_fields = ['account_id', 'account_type']
+            for field in required_fields:
+                if field not in metadata:
+                    raise ValueError(f"Account '{suffix}' missing required field: {field}")
+        
+        return accounts_data
+    
+    @staticmethod
+    def _build_templates(accounts: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Pre-build the lookup result for every known card suffix.
+        
+        Args:
+            accounts: Dictionary mapping card suffixes to account metadata
+            
+        Returns:
+            Dictionary mapping card suffixes to complete lookup results
+        """
+        return {
+            card_suffix: {**account_data, 'card_suffix': card_suffix, 'is_known': True}
+            for card_suffix, account_data in accounts.items()
+        }
+    
     @staticmethod
     def convert_arabic_indic_numerals(text: str) -> str:
         """
         Convert Arabic-Indic numerals to Western (Latin) numerals.
         
-        This method replaces Arabic-Indic digits (٠-٩) with Western equivalents (0-9).
+        This method replaces Arabic-Indic digits (٠-٩) and Extended Arabic-Indic
+        digits (۰-۹, as typed on Persian/Urdu keyboards) with Western
+        equivalents (0-9).
         
         Args:
             text: Input text that may contain Arabic-Indic numerals
@@ -130,21 +253,7 @@ class CardClassifier:
         if not text or not isinstance(text, str):
             return text
         
-        # Define the translation table for Arabic-Indic to Western numerals
-        translation_table = str.maketrans({
-            '٠': '0',  # U+0660
-            '١': '1',  # U+0661
-            '٢': '2',  # U+0662
-            '٣': '3',  # U+0663
-            '٤': '4',  # U+0664
-            '٥': '5',  # U+0665
-            '٦': '6',  # U+0666
-            '٧': '7',  # U+0667
-            '٨': '8',  # U+0668
-            '٩': '9',  # U+0669
-        })
-        
-        return text.translate(translation_table)
+        return text.translate(_ARABIC_INDIC_TABLE)
     
     @staticmethod
     def extract_card_suffix(sms: str) -> Optional[str]:
@@ -173,35 +282,51 @@ class CardClassifier:
         if not sms or not isinstance(sms, str):
             return None
         
+        # Without a trigger word no pattern can match; skip the regex and the
+        # cache so these messages don't evict useful entries
+        folded = sms.casefold()
+        if not any(trigger in folded for trigger in _CARD_SUFFIX_TRIGGERS):
+            return None
+        
+        return CardClassifier._extract_card_suffix_cached(sms)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_card_suffix_cached(sms: str) -> Optional[str]:
+        """
+        Extract card suffix from a non-empty SMS string.
+        
+        Extraction is a pure function of the text, so results are memoized;
+        repeated SMS templates skip the regex scan entirely.
+        
+        Args:
+            sms: Non-empty SMS message text
+            
+        Returns:
+            4-digit card suffix as string, or None if not found
+        """
         # Convert Arabic-Indic numerals first
         normalized_sms = CardClassifier.convert_arabic_indic_numerals(sms)
         
-        # English patterns - various ways to indicate card suffix
-        # Using word boundaries or lookahead to ensure exactly 4 digits
-        english_patterns = [
-            r'(?:ending|card ending|ends with)\s+(\d{4})(?!\d)',  # "ending 1234", "card ending 1234"
-            r'(?:card|Card)\s+(?:number\s+)?(?:\*+\s*)?(\d{4})(?!\d)',  # "card 1234", "Card **1234"
-            r'\*+(\d{4})(?!\d)',  # "**1234", "****1234"
-        ]
-        
-        # Arabic patterns - various ways to indicate card suffix
-        arabic_patterns = [
-            r'(?:رقم|بطاقة رقم|ينتهي)\s+(\d{4})(?!\d)',  # "رقم 1234", "بطاقة رقم 1234"
-            r'(?:بطاقة)\s+(?:\*+\s*)?(\d{4})(?!\d)',  # "بطاقة 1234", "بطاقة **1234"
-        ]
-        
-        # Try all patterns
-        all_patterns = english_patterns + arabic_patterns
-        
-        for pattern in all_patterns:
-            match = re.search(pattern, normalized_sms, re.IGNORECASE | re.UNICODE)
-            if match:
-                suffix = match.group(1)
-                # Ensure it's exactly 4 digits
-                if len(suffix) == 4 and suffix.isdigit():
-                    return suffix
+        if _CARD_SUFFIX_RE2 is not None:
+            for regex in _CARD_SUFFIX_RE2:
+                match = regex.search(normalized_sms)
+                if match:
+                    return match.group(1)
+            return None
+        
+        # Scan once and keep the leftmost match from the highest-priority pattern
+        best_priority = len(_CARD_SUFFIX_PATTERNS)
+        best_suffix = None
         
-        return None
+        for match in _CARD_SUFFIX_RE.finditer(normalized_sms):
+            priority = int(match.lastgroup[1:])
+            if priority < best_priority:
+                best_priority, best_suffix = priority, match.group(match.lastgroup)
+                if priority == 0:
+                    break
+        
+        return best_suffix
     
     def lookup_account(self, card_suffix: str) -> Dict[str, Any]:
         """
@@ -235,14 +360,11 @@ class CardClassifier:
         if not card_suffix:
             return self._create_fallback_account(card_suffix, "Invalid suffix")
         
-        # Look up in loaded accounts
-        if card_suffix in self.accounts:
-            account_data = self.accounts[card_suffix].copy()
-            account_data['card_suffix'] = card_suffix
-            account_data['is_known'] = True
-            
+        # Look up the pre-built result; copy it so callers can't alter the template
+        template = self._templates.get(card_suffix)
+        if template is not None:
             self.logger.info(f"Found account for card suffix {card_suffix}")
-            return account_data
+            return dict(template)
         
         # Fallback for unknown suffix
         self.logger.warning(f"Unknown card suffix: {card_suffix}")
@@ -312,6 +434,7 @@ class CardClassifier:
             self.accounts_file = accounts_file
         
         self.accounts = self._load_accounts()
+        self._templates = self._build_templates(self.accounts)
         self.logger.info("Accounts reloaded successfully")
 
 
@@ -1,10 +1,17 @@
 """Configuration manager for ETL pipeline."""
 import os
 import yaml
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 from pathlib import Path
 
 
+@lru_cache(maxsize=512)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dotted configuration key into its parts, memoized per key."""
+    return tuple(key.split('.'))
+
+
 class ConfigManager:
     """Manages configuration for the ETL pipeline."""
     
@@ -111,10 +118,9 @@ class ConfigManager:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
         value = self.config
         
-        for k in keys:
+        for k in _split_key(key):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
@@ -6,7 +6,7 @@ from .clean import DataCleaner
 from .database import DatabaseManager
 from .transaction_db import TransactionDB
 from .pipeline import ETLPipeline
-from .field_validator import FieldValidator, ParsedTransaction
+from .field_validator import FieldValidator, ParsedTransaction, WarningFlag
 from .schema_normalizer import SchemaNormalizer, TransactionRecord
 from .promo_classifier import PromoClassifier, PromoResult
 from .categorizer import Categorizer
@@ -26,6 +26,7 @@ __all__ = [
     "ETLPipeline",
     "FieldValidator",
     "ParsedTransaction",
+    "WarningFlag",
     "SchemaNormalizer",
     "TransactionRecord",
     "PromoClassifier",
@@ -9,13 +9,142 @@ This module provides intelligent categorization of transactions based on:
 """
 from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
+from functools import lru_cache
+from collections import Counter
+import hashlib
+import pickle
 import yaml
 import json
 import re
-from fuzzywuzzy import fuzz
+import unicodedata
+import numpy as np
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import Indel, Levenshtein
 from goldminer.utils import setup_logger
 from goldminer.etl.schema_normalizer import TransactionRecord
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+try:
+    import orjson  # Optional: faster parsing of JSON rule files
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick  # Optional: pyahocorasick scans all keywords in one pass
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2  # Optional: google-re2 matches all regex rules in one pass
+except ImportError:
+    re2 = None
+
+
+# Names fuzzy-scored per cdist call, bounding the score matrices' memory
+_FUZZY_BLOCK_SIZE = 4096
+
+# Fuzzy scores reproduce fuzzywuzzy's: integer scores, token ratios over its
+# full_process form, and partial_ratio over windows aligned on matching blocks.
+# rapidfuzz's own scorers return unrounded floats and its partial_ratio also
+# scores windows overhanging either end of the longer string, so they are only
+# used to rule out pairs that cannot reach a cutoff.
+
+# Token ratio scorers, applied to _fuzzy_process'd strings
+_FUZZY_TOKEN_SCORERS = (fuzz.token_sort_ratio, fuzz.token_set_ratio)
+
+# fuzzywuzzy's full_process (force_ascii) drops U+0080-U+00FF and turns
+# non-word characters into spaces
+_FUZZY_DROPPED_CHARS = dict.fromkeys(range(128, 256))
+_FUZZY_NON_WORD = re.compile(r"(?ui)\W")
+
+
+def _fuzzy_process(text: str) -> str:
+    """Preprocess text as fuzzywuzzy's full_process did for token ratios."""
+    return _FUZZY_NON_WORD.sub(' ', text.translate(_FUZZY_DROPPED_CHARS)).lower().strip()
+
+
+def _fuzzy_cutoff(score_cutoff: float) -> float:
+    """Return the rapidfuzz score_cutoff of scores rounding to score_cutoff or more."""
+    return max(score_cutoff - 0.5, 0)
+
+
+def _partial_ratio(s1: str, s2: str, score_cutoff: float = 0) -> int:
+    """
+    Score two strings as fuzzywuzzy's partial_ratio did.
+    
+    The shorter string is compared with windows of the longer one starting
+    where their matching blocks line up, so a contained string does not always
+    score 100.
+    
+    Args:
+        s1: First string
+        s2: Second string
+        score_cutoff: Scores below it may be returned as 0
+        
+    Returns:
+        Score between 0 and 100
+    """
+    if s1 == s2:
+        return 100
+    if not s1 or not s2:
+        return 0
+    
+    # rapidfuzz's partial_ratio never scores more than half a point lower
+    if score_cutoff and not fuzz.partial_ratio(s1, s2, score_cutoff=_fuzzy_cutoff(score_cutoff)):
+        return 0
+    
+    shorter, longer = (s1, s2) if len(s1) <= len(s2) else (s2, s1)
+    best = 0
+    for shorter_start, longer_start, _ in Levenshtein.opcodes(shorter, longer).as_matching_blocks():
+        window_start = max(longer_start - shorter_start, 0)
+        window = longer[window_start:window_start + len(shorter)]
+        similarity = Indel.normalized_similarity(shorter, window)
+        if similarity > .995:
+            return 100
+        best = max(best, similarity)
+    return int(round(100 * best))
+
+
+def _normalize_text(text: str) -> str:
+    """
+    Bring text to one canonical form for the merchant and keyword indexes.
+    
+    Applies NFKC (folding Arabic presentation forms, ligatures and full-width
+    characters) and drops combining marks such as Arabic harakat.
+    """
+    if text.isascii():
+        return text
+    text = unicodedata.normalize('NFKC', text)
+    return ''.join(char for char in text if not unicodedata.combining(char))
+
+
+def _merge_tags(existing_tags: Optional[List[str]], tags: List[str]) -> List[str]:
+    """
+    Merge rule tags into a record's existing tags, dropping duplicates.
+    """
+    merged = set(existing_tags or ())
+    merged.update(tags)
+    return list(merged)
+
+
+# Tag key of a categorize_columns entry whose tags could not be normalized
+_INVALID_TAGS = object()
+
+# Distinct (merchant, tags) lookups memoized per Categorizer
+_LOOKUP_CACHE_SIZE = 100_000
+
+# Rules file used when no rules_path is given, in the project root
+_DEFAULT_RULES_PATH = Path(__file__).resolve().parent.parent.parent / "category_rules.yaml"
+
+# Validated rules per resolved file path, as (blake2b digest of the file,
+# pickled rules). Unpickling gives every Categorizer its own copy far faster
+# than re-parsing, and the digest catches edits that keep mtime and size.
+_RULES_CACHE: Dict[str, Tuple[bytes, bytes]] = {}
+
 
 class Categorizer:
     """
@@ -57,13 +186,24 @@ class Categorizer:
         
         # Load rules
         if rules_path is None:
-            # Default to category_rules.yaml in project root
-            project_root = Path(__file__).parent.parent.parent
-            rules_path = project_root / "category_rules.yaml"
+            rules_path = _DEFAULT_RULES_PATH
         
         self.rules = self._load_rules(rules_path)
+        self._build_match_index()
         self.logger.info(f"Categorizer initialized with {len(self.rules.get('categories', []))} category rules")
     
+    @property
+    def fuzzy_threshold(self) -> int:
+        """Minimum similarity score for fuzzy matching (0-100)."""
+        return self._fuzzy_threshold
+    
+    @fuzzy_threshold.setter
+    def fuzzy_threshold(self, value: int) -> None:
+        self._fuzzy_threshold = value
+        # Memoized lookups were fuzzy-matched against the previous threshold
+        if hasattr(self, '_lookup'):
+            self._lookup.cache_clear()
+    
     def _load_rules(self, rules_path: str) -> Dict[str, Any]:
         """
         Load categorization rules from YAML or JSON file.
@@ -85,13 +225,24 @@ class Categorizer:
             raise FileNotFoundError(f"Rules file not found: {rules_path}")
         
         try:
-            with open(rules_path, 'r', encoding='utf-8') as f:
-                if rules_path.suffix in ['.yaml', '.yml']:
-                    rules = yaml.safe_load(f)
-                elif rules_path.suffix == '.json':
-                    rules = json.load(f)
-                else:
-                    raise ValueError(f"Unsupported file format: {rules_path.suffix}")
+            # Reuse the parsed rules while the file content is unchanged
+            data = rules_path.read_bytes()
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            cache_key = str(rules_path.resolve())
+            cached = _RULES_CACHE.get(cache_key)
+            if cached is not None and cached[0] == digest:
+                rules = pickle.loads(cached[1])
+                self.logger.info(f"Loaded {len(rules.get('categories', []))} category rules from {rules_path} (cached)")
+                return rules
+            
+            if rules_path.suffix == '.json' and orjson is not None:
+                rules = orjson.loads(data)
+            elif rules_path.suffix in ['.yaml', '.yml']:
+                rules = yaml.load(data.decode('utf-8'), Loader=SafeLoader)
+            elif rules_path.suffix == '.json':
+                rules = json.loads(data.decode('utf-8'))
+            else:
+                raise ValueError(f"Unsupported file format: {rules_path.suffix}")
             
             # Validate rules structure
             if not isinstance(rules, dict):
@@ -100,6 +251,8 @@ class Categorizer:
             if 'categories' not in rules:
                 raise ValueError("Rules must contain 'categories' key")
             
+            _RULES_CACHE[cache_key] = (digest, pickle.dumps(rules, protocol=pickle.HIGHEST_PROTOCOL))
+            
             self.logger.info(f"Loaded {len(rules.get('categories', []))} category rules from {rules_path}")
             return rules
             
@@ -107,6 +260,207 @@ class Categorizer:
             self.logger.error(f"Error loading rules from {rules_path}: {str(e)}")
             raise
     
+    def _build_match_index(self) -> None:
+        """
+        Precompute matching structures from the loaded rules.
+        
+        Called whenever rules are (re)loaded so matching does not have to walk
+        and re-normalize the raw rule dictionaries for every record.
+        """
+        # Memoized stage lookup; a fresh cache per (re)load so stale results
+        # never outlive the rules they came from
+        self._lookup = lru_cache(maxsize=_LOOKUP_CACHE_SIZE)(self._lookup_uncached)
+        
+        # New format rules, each with the (category, subcategory, tags) result
+        # it assigns: casefolded match values mapped to the first rule listing
+        # them, and regex and tag rules in rule order, kept like the fuzzy
+        # aliases as parallel lists of match keys and results. match_regex
+        # patterns are compiled here rather than on every comparison; invalid
+        # ones are dropped.
+        self._match_index = {}
+        self._regex_patterns = []
+        self._regex_results = []
+        self._tag_rule_tags = []
+        self._tag_rule_results = []
+        for rule in self.rules.get('rules') or []:
+            result = (
+                rule.get('category', 'Uncategorized'),
+                rule.get('subcategory', 'General'),
+                rule.get('tags', [])
+            )
+            if 'match' in rule:
+                self._match_index.setdefault(str(rule['match']).casefold().strip(), result)
+            if 'match_regex' in rule:
+                pattern = rule['match_regex']
+                try:
+                    self._regex_patterns.append(re.compile(pattern, re.IGNORECASE))
+                    self._regex_results.append(result)
+                except (re.error, TypeError) as e:
+                    self.logger.warning(f"Invalid regex pattern '{pattern}': {str(e)}")
+            if 'match_tag' in rule:
+                self._tag_rule_tags.append(str(rule['match_tag']).lower())
+                self._tag_rule_results.append(result)
+        self._has_tag_rules = bool(self._tag_rule_tags)
+        
+        # With google-re2 installed, regex rules RE2 matches exactly like re are
+        # searched together in one DFA pass; the rest keep using re
+        self._regex_set = None
+        self._regex_set_rules = []
+        self._regex_fallback_rules = []
+        if re2 is not None and len(self._regex_patterns) > 1:
+            self._build_regex_set()
+        
+        # Merchant names and keywords below are indexed in _normalize_text form
+        
+        # Casefolded exact merchant names mapped to the first rule listing them
+        self._exact_index = {}
+        
+        # Lowercased fuzzy merchant aliases and the (category, subcategory, tags)
+        # result of the rule each one belongs to, in rule order. A repeated alias
+        # scores the same as its first occurrence and ties keep the first, so
+        # only the first is indexed.
+        self._merchant_index = []
+        self._merchant_results = []
+        # _fuzzy_process form of each alias, for the token ratios
+        self._merchant_index_processed = []
+        indexed_aliases = set()
+        
+        for rule in self.rules.get('categories', []):
+            result = (
+                rule.get('category'),
+                rule.get('subcategory'),
+                rule.get('tags', [])
+            )
+            for exact_merchant in rule.get('merchant_exact', []):
+                self._exact_index.setdefault(_normalize_text(exact_merchant).strip().casefold(), result)
+            for fuzzy_merchant in rule.get('merchant_fuzzy', []):
+                fuzzy_merchant_lower = _normalize_text(fuzzy_merchant).lower().strip()
+                if fuzzy_merchant_lower not in indexed_aliases:
+                    indexed_aliases.add(fuzzy_merchant_lower)
+                    self._merchant_index.append(fuzzy_merchant_lower)
+                    self._merchant_index_processed.append(_fuzzy_process(fuzzy_merchant_lower))
+                    self._merchant_results.append(result)
+        
+        # Aho-Corasick automaton of the non-empty aliases, used when
+        # pyahocorasick is installed to find the aliases contained in each of
+        # a batch of merchants, which get the substring boost
+        self._merchant_automaton = None
+        if ahocorasick is not None:
+            self._merchant_automaton = self._build_keyword_automaton(
+                (alias, index) for index, alias in enumerate(self._merchant_index) if alias
+            )
+        
+        # Keyword rules in priority order: lowercased English keywords,
+        # case-sensitive Arabic keywords, and the rule's result
+        self._keyword_rules = []
+        for rule in self.rules.get('categories', []):
+            keywords = rule.get('keywords', {})
+            self._keyword_rules.append((
+                tuple(_normalize_text(keyword).lower() for keyword in keywords.get('english', [])),
+                tuple(_normalize_text(keyword) for keyword in keywords.get('arabic', [])),
+                (rule.get('category'), rule.get('subcategory'), rule.get('tags', []))
+            ))
+        
+        # English and Arabic Aho-Corasick automata, used when pyahocorasick is
+        # installed. An empty keyword matches every text ('' in merchant), which
+        # an automaton cannot express, so such rule sets keep the plain loop.
+        self._keyword_automata = None
+        if ahocorasick is not None and all(
+            keyword for english, arabic, _ in self._keyword_rules for keyword in english + arabic
+        ):
+            self._keyword_automata = (
+                self._build_keyword_automaton(
+                    (keyword, index) for index, (english, _, _) in enumerate(self._keyword_rules)
+                    for keyword in english
+                ),
+                self._build_keyword_automaton(
+                    (keyword, index) for index, (_, arabic, _) in enumerate(self._keyword_rules)
+                    for keyword in arabic
+                )
+            )
+        
+        # Without automata, one fused regex per language rejects texts that
+        # contain no keyword at all before the per-rule loop runs
+        self._keyword_prefilters = None
+        if self._keyword_automata is None:
+            self._keyword_prefilters = (
+                self._build_keyword_prefilter(
+                    keyword for english, _, _ in self._keyword_rules for keyword in english
+                ),
+                self._build_keyword_prefilter(
+                    keyword for _, arabic, _ in self._keyword_rules for keyword in arabic
+                )
+            )
+    
+    def _build_regex_set(self) -> None:
+        """
+        Compile the RE2-compatible match_regex rules into one RE2 set.
+        
+        RE2 and re agree on ASCII patterns searched in printable ASCII text,
+        except for re's "{,n}" repeats and the POSIX-looking "[:" sets, so
+        only such patterns join the set (matching falls back to re for other
+        text). Rules whose patterns RE2 rejects are recorded by index so they
+        can still be checked with re in priority order.
+        """
+        options = re2.Options()
+        options.case_sensitive = False
+        regex_set = re2.Set.SearchSet(options)
+        
+        for index, pattern in enumerate(self._regex_patterns):
+            source = pattern.pattern
+            if source.isascii() and '{,' not in source and '[:' not in source:
+                try:
+                    regex_set.Add(source)
+                except re2.error:
+                    pass
+                else:
+                    self._regex_set_rules.append(index)
+                    continue
+            self._regex_fallback_rules.append(index)
+        
+        if self._regex_set_rules:
+            regex_set.Compile()
+            self._regex_set = regex_set
+    
+    @staticmethod
+    def _build_keyword_prefilter(keywords) -> Optional[re.Pattern]:
+        """
+        Compile keywords into one alternation matching wherever any of them occurs.
+        
+        Args:
+            keywords: Iterable of keywords
+            
+        Returns:
+            Compiled pattern, or None if there are no keywords
+        """
+        keywords = list(dict.fromkeys(keywords))
+        if not keywords:
+            return None
+        return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+    
+    @staticmethod
+    def _build_keyword_automaton(keywords) -> Optional[Any]:
+        """
+        Build an Aho-Corasick automaton mapping each keyword to its first index.
+        
+        Args:
+            keywords: Iterable of (keyword, index) pairs in priority order
+            
+        Returns:
+            Automaton whose values are the indexes, or None if there are no
+            keywords to match
+        """
+        automaton = ahocorasick.Automaton()
+        for keyword, index in keywords:
+            if keyword not in automaton:
+                automaton.add_word(keyword, index)
+        
+        if len(automaton) == 0:
+            return None
+        
+        automaton.make_automaton()
+        return automaton
+    
     def load_rules(self, filepath: str) -> None:
         """
         Load or reload categorization rules from a YAML configuration file.
@@ -157,34 +511,66 @@ class Categorizer:
             return
         
         try:
-            with open(filepath_obj, 'r', encoding='utf-8') as f:
-                new_rules = yaml.safe_load(f)
+            text = filepath_obj.read_text(encoding='utf-8')
+        except Exception as e:
+            self.logger.error(f"Error loading rules from {filepath}: {str(e)}. Keeping existing rules.")
+            return
+        
+        self._apply_rules_text(text, filepath)
+    
+    def load_rules_from_string(self, text: str) -> None:
+        """
+        Load or reload categorization rules from a YAML string.
+        
+        Same as load_rules, with the same formats and safe fallback, but
+        without reading a file.
+        
+        Args:
+            text: YAML document containing the rules
+            
+        Examples:
+            >>> categorizer = Categorizer()
+            >>> categorizer.load_rules_from_string('''
+            ... rules:
+            ...   - match: "Uber"
+            ...     category: "Transport"
+            ... ''')
+        """
+        self._apply_rules_text(text, "rules string")
+    
+    def _apply_rules_text(self, text: str, source: str) -> None:
+        """
+        Parse, validate and install rules, keeping existing rules on failure.
+        
+        Args:
+            text: YAML document containing the rules
+            source: Where the text came from, for log messages
+        """
+        try:
+            new_rules = yaml.load(text, Loader=SafeLoader)
             
             # Validate rules structure
             if not isinstance(new_rules, dict):
-                self.logger.error(f"Invalid rules format in {filepath}: must be a dictionary. Keeping existing rules.")
+                self.logger.error(f"Invalid rules format in {source}: must be a dictionary. Keeping existing rules.")
                 return
             
             # Support both 'rules' (new format) and 'categories' (legacy format) keys
             if 'rules' not in new_rules and 'categories' not in new_rules:
-                self.logger.error(f"Invalid rules format in {filepath}: must contain 'rules' or 'categories' key. Keeping existing rules.")
+                self.logger.error(f"Invalid rules format in {source}: must contain 'rules' or 'categories' key. Keeping existing rules.")
                 return
             
             # Update the rules
             self.rules = new_rules
+            self._build_match_index()
             
             # Count rules for logging
             rule_count = len(new_rules.get('rules', [])) + len(new_rules.get('categories', []))
-            self.logger.info(f"Successfully loaded/reloaded {rule_count} rules from {filepath}")
+            self.logger.info(f"Successfully loaded/reloaded {rule_count} rules from {source}")
             
         except yaml.YAMLError as e:
-            self.logger.error(f"YAML parsing error in {filepath}: {str(e)}. Keeping existing rules.")
+            self.logger.error(f"YAML parsing error in {source}: {str(e)}. Keeping existing rules.")
         except Exception as e:
-            self.logger.error(f"Error loading rules from {filepath}: {str(e)}. Keeping existing rules.")
-
-        except Exception as e:
-            self.logger.error(f"Error loading rules from {rules_path}: {str(e)}")
-            raise
+            self.logger.error(f"Error loading rules from {source}: {str(e)}. Keeping existing rules.")
     
     def categorize(self, record: TransactionRecord) -> TransactionRecord:
         """
@@ -214,92 +600,381 @@ class Categorizer:
             >>> categorized.subcategory
             'Restaurants'
         """
+        merchant = record.normalized_merchant or record.payee
+        if merchant:
+            # Tags only affect the result when there are match_tag rules, so
+            # leave them out of the cache key otherwise
+            record_tags = None
+            if self._has_tag_rules and record.tags:
+                record_tags = frozenset(tag.lower() for tag in record.tags)
+            
+            match = self._lookup(merchant, record_tags)
+            if match:
+                result, stage = match
+                return self._apply_match(record, result, stage)
+        
+        # Fallback to uncategorized
+        fallback = self.rules.get('fallback', {})
+        record.category = fallback.get('category', 'Uncategorized')
+        record.subcategory = fallback.get('subcategory', 'General')
+        record.tags = _merge_tags(record.tags, fallback.get('tags', []))
+        self.logger.debug(f"Fallback categorization: {record.payee} -> Uncategorized")
+        return record
+    
+    def _lookup_uncached(
+        self,
+        merchant: str,
+        record_tags: Optional[frozenset]
+    ) -> Optional[Tuple[Tuple[str, str, List[str]], str]]:
+        """
+        Run the matching stages in priority order for a merchant.
+        
+        Depends only on its arguments, the indexes built from the rules and
+        fuzzy_threshold, so it is memoized per instance as _lookup and the
+        memo is cleared when either changes.
+        
+        Args:
+            merchant: Merchant name of the record
+            record_tags: Lowercased record tags if match_tag rules exist, else None
+            
+        Returns:
+            Tuple of ((category, subcategory, tags), stage name) for the first
+            matching stage, or None if no stage matches
+        """
+        match, merchant, merchant_lower = self._match_leading_stages(merchant, record_tags)
+        if match:
+            return match
+        
+        # Try fuzzy merchant match (legacy format)
+        result = self._match_fuzzy_merchant(merchant_lower)
+        if result:
+            return result, "Fuzzy merchant match"
+        
+        return self._match_keyword_stage(merchant, merchant_lower)
+    
+    def _match_leading_stages(
+        self,
+        merchant: str,
+        record_tags: Optional[frozenset]
+    ) -> Tuple[Optional[Tuple[Tuple[str, str, List[str]], str]], str, str]:
+        """
+        Run the matching stages that come before fuzzy matching.
+        
+        Args:
+            merchant: Merchant name of the record
+            record_tags: Lowercased record tags if match_tag rules exist, else None
+            
+        Returns:
+            Tuple of (match, normalized merchant, lowercased normalized
+            merchant), where match is ((category, subcategory, tags), stage
+            name) or None. The merchant forms are those the later stages expect.
+        """
+        # Normalize once, then stop at the first stage that matches
+        merchant_folded = merchant.casefold().strip()
+        
         # Try new format rules first (match, match_regex, match_tag)
-        result = self._match_new_format(record)
+        result = self._match_new_format(merchant, merchant_folded, record_tags)
         if result:
-            category, subcategory, tags = result
-            record.category = category
-            record.subcategory = subcategory
-            # Merge with existing tags
-            existing_tags = set(record.tags) if record.tags else set()
-            record.tags = list(existing_tags | set(tags))
-            self.logger.debug(f"New format match: {record.payee} -> {category}/{subcategory}")
-            return record
+            return (result, "New format match"), merchant, merchant_folded
+        
+        # Legacy indexes hold normalized text, so normalize the merchant to match
+        merchant = _normalize_text(merchant)
+        merchant_lower = merchant.lower().strip()
         
         # Try exact merchant match (legacy format)
-        result = self._match_exact_merchant(record)
+        result = self._match_exact_merchant(merchant)
         if result:
-            category, subcategory, tags = result
-            record.category = category
-            record.subcategory = subcategory
-            # Merge with existing tags
-            existing_tags = set(record.tags) if record.tags else set()
-            record.tags = list(existing_tags | set(tags))
-            self.logger.debug(f"Exact merchant match: {record.payee} -> {category}/{subcategory}")
-            return record
+            return (result, "Exact merchant match"), merchant, merchant_lower
         
-        # Try fuzzy merchant match (legacy format)
-        result = self._match_fuzzy_merchant(record)
-        if result:
-            category, subcategory, tags = result
-            record.category = category
-            record.subcategory = subcategory
-            existing_tags = set(record.tags) if record.tags else set()
-            record.tags = list(existing_tags | set(tags))
-            self.logger.debug(f"Fuzzy merchant match: {record.payee} -> {category}/{subcategory}")
-            return record
+        return None, merchant, merchant_lower
+    
+    def _match_keyword_stage(
+        self,
+        merchant: str,
+        merchant_lower: str
+    ) -> Optional[Tuple[Tuple[str, str, List[str]], str]]:
+        """
+        Run the keyword stage, the last one before the fallback.
         
+        Args:
+            merchant: Normalized merchant name
+            merchant_lower: Lowercased, stripped normalized merchant name
+            
+        Returns:
+            Tuple of ((category, subcategory, tags), stage name), or None
+        """
         # Try keyword match (legacy format)
-        result = self._match_keywords(record)
+        result = self._match_keywords(merchant, merchant_lower)
         if result:
-            category, subcategory, tags = result
-            record.category = category
-            record.subcategory = subcategory
-            existing_tags = set(record.tags) if record.tags else set()
-            record.tags = list(existing_tags | set(tags))
-            self.logger.debug(f"Keyword match: {record.payee} -> {category}/{subcategory}")
-            return record
+            return result, "Keyword match"
         
-        # Fallback to uncategorized
-        fallback = self.rules.get('fallback', {})
-        record.category = fallback.get('category', 'Uncategorized')
-        record.subcategory = fallback.get('subcategory', 'General')
-        existing_tags = set(record.tags) if record.tags else set()
-        fallback_tags = set(fallback.get('tags', []))
-        record.tags = list(existing_tags | fallback_tags)
-        self.logger.debug(f"Fallback categorization: {record.payee} -> Uncategorized")
-        return record
-        fallback_tags = set(fallback.get('tags', []))
-        record.tags = list(existing_tags | fallback_tags)
-        self.logger.debug(f"Fallback categorization: {record.payee} -> Uncategorized")
+        return None
+    
+    def _apply_match(
+        self,
+        record: TransactionRecord,
+        result: Tuple[str, str, List[str]],
+        stage: str
+    ) -> TransactionRecord:
+        """
+        Assign a matched category to a record, merging its existing tags.
+        
+        Args:
+            record: TransactionRecord being categorized
+            result: Tuple of (category, subcategory, tags) from a matching stage
+            stage: Name of the matching stage, for logging
+            
+        Returns:
+            The updated TransactionRecord
+        """
+        category, subcategory, tags = result
+        record.category = category
+        record.subcategory = subcategory
+        record.tags = _merge_tags(record.tags, tags)
+        self.logger.debug(f"{stage}: {record.payee} -> {category}/{subcategory}")
         return record
     
-    def categorize_batch(self, records: List[TransactionRecord]) -> List[TransactionRecord]:
+    def categorize_batch(
+        self,
+        records: List[TransactionRecord],
+        workers: Optional[int] = None
+    ) -> List[TransactionRecord]:
         """
         Categorize a batch of transaction records.
         
+        The merchant and tag fields are gathered into columns and matched by
+        categorize_columns; the results are then written back to the records,
+        merged with their existing tags.
+        
         Args:
             records: List of TransactionRecord objects
+            workers: Number of threads for batched fuzzy scoring. Defaults to
+                    the CPU count; 1 forces serial processing.
             
         Returns:
             List of categorized TransactionRecord objects
         """
-        categorized = []
-        for record in records:
+        merchants = [record.normalized_merchant or record.payee for record in records]
+        record_tags = [record.tags for record in records] if self._has_tag_rules else None
+        
+        categories, subcategories, tags_column = self.categorize_columns(merchants, record_tags, workers)
+        
+        merge_tags = _merge_tags
+        for record, category, subcategory, tags in zip(records, categories, subcategories, tags_column):
             try:
-                categorized_record = self.categorize(record)
-                categorized.append(categorized_record)
+                record.tags = merge_tags(record.tags, tags)
+                record.category = category
+                record.subcategory = subcategory
             except Exception as e:
                 self.logger.error(f"Error categorizing record {record.id}: {str(e)}")
-                # Add uncategorized record on error
+                # Leave the record uncategorized on error
                 record.category = 'Uncategorized'
                 record.subcategory = 'General'
-                categorized.append(record)
         
-        self.logger.info(f"Categorized batch of {len(categorized)} records")
-        return categorized
+        self.logger.info(f"Categorized batch of {len(records)} records")
+        return records
+    
+    def categorize_columns(
+        self,
+        merchants: List[Optional[str]],
+        record_tags: Optional[List[Optional[List[str]]]] = None,
+        workers: Optional[int] = None
+    ) -> Tuple[List[str], List[str], List[List[str]]]:
+        """
+        Categorize a column of merchant names.
+        
+        Column-wise counterpart of categorize for callers holding merchants as
+        a plain list (or a pandas/pyarrow column converted with tolist()).
+        Repeated merchants are matched once, and all merchants that reach the
+        fuzzy stage are scored in one batch; results keep the input order.
+        
+        Args:
+            merchants: Merchant name of each transaction; empty or None
+                      entries fall back to uncategorized
+            record_tags: Existing tags of each transaction, used by match_tag
+                        rules. Parallel to merchants.
+            workers: Number of threads for batched fuzzy scoring. Defaults to
+                    the CPU count; 1 forces serial processing.
+            
+        Returns:
+            Tuple of parallel (categories, subcategories, tags) lists. Tags are
+            copies of those of the matching rule (or the fallback), not merged
+            with record_tags.
+            
+        Examples:
+            >>> categorizer = Categorizer()
+            >>> categories, subcategories, tags = categorizer.categorize_columns(["McDonald's", None])
+            >>> categories
+            ['Food & Dining', 'Uncategorized']
+        """
+        # Per-entry loops use locals instead of repeated attribute lookups
+        match_leading_stages = self._match_leading_stages
+        match_keyword_stage = self._match_keyword_stage
+        log_error = self.logger.error
+        
+        # Tags only affect the result when there are match_tag rules, so
+        # leave them out of the lookup key otherwise. Entries whose tags
+        # cannot be normalized fall back without failing the other entries.
+        if self._has_tag_rules and record_tags is not None:
+            tag_keys = []
+            add_tag_key = tag_keys.append
+            for merchant, tags in zip(merchants, record_tags):
+                try:
+                    add_tag_key(frozenset(tag.lower() for tag in tags) if tags else None)
+                except Exception as e:
+                    log_error(f"Error categorizing merchant {merchant!r}: {str(e)}")
+                    add_tag_key(_INVALID_TAGS)
+        else:
+            tag_keys = [None] * len(merchants)
+        
+        # Each distinct (merchant, tags) pair is matched once. Pairs that get
+        # past the exact stages are fuzzy-scored together, then keyword-matched.
+        keys = list(zip(merchants, tag_keys))
+        unique_matches = {key: None for key in keys if key[0] and key[1] is not _INVALID_TAGS}
+        pending = []
+        add_pending = pending.append
+        for key in unique_matches:
+            try:
+                match, merchant, merchant_lower = match_leading_stages(*key)
+            except Exception as e:
+                log_error(f"Error categorizing merchant {key[0]!r}: {str(e)}")
+                continue
+            if match:
+                unique_matches[key] = match
+            else:
+                add_pending((key, merchant, merchant_lower))
+        
+        try:
+            fuzzy_results = self._match_fuzzy_merchants(
+                [merchant_lower for _, _, merchant_lower in pending], workers
+            )
+        except Exception as e:
+            # Score names one at a time instead, so a failure only affects
+            # the entries it belongs to
+            log_error(f"Error fuzzy-matching merchant batch: {str(e)}")
+            fuzzy_results = None
+        
+        match_fuzzy_merchant = self._match_fuzzy_merchant
+        for index, (key, merchant, merchant_lower) in enumerate(pending):
+            try:
+                if fuzzy_results is not None:
+                    result = fuzzy_results[index]
+                else:
+                    result = match_fuzzy_merchant(merchant_lower)
+                if result:
+                    unique_matches[key] = (result, "Fuzzy merchant match")
+                else:
+                    unique_matches[key] = match_keyword_stage(merchant, merchant_lower)
+            except Exception as e:
+                log_error(f"Error categorizing merchant {key[0]!r}: {str(e)}")
+        
+        matches = list(map(unique_matches.get, keys))
+        
+        fallback = self.rules.get('fallback', {})
+        fallback_result = (
+            fallback.get('category', 'Uncategorized'),
+            fallback.get('subcategory', 'General'),
+            fallback.get('tags', [])
+        )
+        
+        results = [match[0] if match else fallback_result for match in matches]
+        if not results:
+            return [], [], []
+        categories, subcategories, tags_column = map(list, zip(*results))
+        # Rule tag lists are shared by every match, so each entry gets a copy
+        tags_column = [list(tags) for tags in tags_column]
+        return categories, subcategories, tags_column
+    
+    def _match_fuzzy_merchants(
+        self,
+        merchants_lower: List[str],
+        workers: Optional[int] = None
+    ) -> List[Optional[Tuple[str, str, List[str]]]]:
+        """
+        Fuzzy-match many merchant names at once.
+        
+        Gives the same results as calling _match_fuzzy_merchant on each name,
+        but scores whole blocks of names against every alias with
+        rapidfuzz.process.cdist, which runs in C++ across threads.
+        
+        Args:
+            merchants_lower: Lowercased, stripped merchant names
+            workers: Number of threads for cdist. Defaults to all CPUs.
+            
+        Returns:
+            Tuple of (category, subcategory, tags) or None for each name
+        """
+        if not merchants_lower or not self._merchant_index:
+            return [None] * len(merchants_lower)
+        
+        cutoff = _fuzzy_cutoff(self.fuzzy_threshold)
+        empty_aliases = [index for index, alias in enumerate(self._merchant_index) if not alias]
+        
+        results = []
+        for start in range(0, len(merchants_lower), _FUZZY_BLOCK_SIZE):
+            block = merchants_lower[start:start + _FUZZY_BLOCK_SIZE]
+            block_processed = [_fuzzy_process(merchant_lower) for merchant_lower in block]
+            scores = None
+            for scorer in _FUZZY_TOKEN_SCORERS:
+                block_scores = process.cdist(
+                    block_processed, self._merchant_index_processed, scorer=scorer,
+                    score_cutoff=cutoff, dtype=np.float64, workers=workers or -1
+                )
+                scores = block_scores if scores is None else np.maximum(scores, block_scores, out=scores)
+            np.round(scores, out=scores)
+            
+            # rapidfuzz's partial_ratio bounds fuzzywuzzy's from above, so only
+            # pairs it scores above the token ratios need an exact score
+            partial_bounds = process.cdist(
+                block, self._merchant_index, scorer=fuzz.partial_ratio,
+                score_cutoff=cutoff, dtype=np.float64, workers=workers or -1
+            )
+            for row, index in zip(*np.nonzero(partial_bounds >= scores + 0.5)):
+                scores[row, index] = max(
+                    scores[row, index], _partial_ratio(block[row], self._merchant_index[index])
+                )
+            
+            # Substring boost for the aliases contained in each name; an empty
+            # alias is contained in every one
+            for row, merchant_lower in enumerate(block):
+                contained = self._contained_aliases(merchant_lower) + empty_aliases
+                if contained:
+                    scores[row, contained] = np.maximum(scores[row, contained], 90)
+            
+            # argmax keeps the first alias among equal scores, as the
+            # single-name matcher does
+            best_indexes = scores.argmax(axis=1)
+            best_scores = scores[np.arange(len(block)), best_indexes]
+            results.extend(
+                self._merchant_results[index] if score >= self.fuzzy_threshold and score > 0 else None
+                for index, score in zip(best_indexes.tolist(), best_scores.tolist())
+            )
+        
+        return results
+    
+    def _contained_aliases(self, merchant_lower: str) -> List[int]:
+        """
+        Find the non-empty fuzzy aliases contained in a merchant name.
+        
+        Args:
+            merchant_lower: Lowercased, stripped merchant name
+            
+        Returns:
+            Indexes of the aliases in the merchant index
+        """
+        if self._merchant_automaton is not None:
+            return list({index for _, index in self._merchant_automaton.iter(merchant_lower)})
+        return [
+            index for index, alias in enumerate(self._merchant_index)
+            if alias and alias in merchant_lower
+        ]
     
-    def _match_new_format(self, record: TransactionRecord) -> Optional[Tuple[str, str, List[str]]]:
+    def _match_new_format(
+        self,
+        merchant: str,
+        merchant_folded: str,
+        record_tags: Optional[frozenset]
+    ) -> Optional[Tuple[str, str, List[str]]]:
         """
         Try to match using new rule format (match, match_regex, match_tag).
         
@@ -309,195 +984,147 @@ class Categorizer:
         3. match_tag (tag-based match)
         
         Args:
-            record: TransactionRecord to match
+            merchant: Merchant name of the record
+            merchant_folded: Casefolded, stripped merchant name, used by match
+            record_tags: Lowercased tags of the record, used by match_tag
             
         Returns:
             Tuple of (category, subcategory, tags) if match found, None otherwise
         """
-        # Get rules in new format
-        new_rules = self.rules.get('rules', [])
-        if not new_rules:
-            return None
-        
-        if not record.normalized_merchant and not record.payee:
-            return None
-        
-        merchant = record.normalized_merchant or record.payee
-        if not merchant:
-            return None
-        
-        merchant_lower = merchant.lower().strip()
-        
         # Priority 1: Try exact match
-        for rule in new_rules:
-            if 'match' in rule:
-                match_value = rule['match']
-                if match_value.lower().strip() == merchant_lower:
-                    return (
-                        rule.get('category', 'Uncategorized'),
-                        rule.get('subcategory', 'General'),
-                        rule.get('tags', [])
-                    )
+        result = self._match_index.get(merchant_folded)
+        if result:
+            return result
         
         # Priority 2: Try regex match
-        for rule in new_rules:
-            if 'match_regex' in rule:
-                try:
-                    pattern = rule['match_regex']
-                    if re.search(pattern, merchant, re.IGNORECASE):
-                        return (
-                            rule.get('category', 'Uncategorized'),
-                            rule.get('subcategory', 'General'),
-                            rule.get('tags', [])
-                        )
-                except re.error as e:
-                    self.logger.warning(f"Invalid regex pattern '{pattern}': {str(e)}")
-                    continue
+        if self._regex_set is not None and merchant.isascii() and merchant.isprintable() and merchant:
+            # The first rule RE2 matches wins unless an earlier rule left to
+            # re also matches
+            matched = self._regex_set.Match(merchant)
+            first = min(self._regex_set_rules[i] for i in matched) if matched else None
+            for index in self._regex_fallback_rules:
+                if first is not None and index > first:
+                    break
+                if self._regex_patterns[index].search(merchant):
+                    return self._regex_results[index]
+            if first is not None:
+                return self._regex_results[first]
+        else:
+            for pattern, result in zip(self._regex_patterns, self._regex_results):
+                if pattern.search(merchant):
+                    return result
         
         # Priority 3: Try tag match
-        if record.tags:
-            record_tags = set(tag.lower() for tag in record.tags)
-            for rule in new_rules:
-                if 'match_tag' in rule:
-                    match_tag = rule['match_tag'].lower()
-                    if match_tag in record_tags:
-                        return (
-                            rule.get('category', 'Uncategorized'),
-                            rule.get('subcategory', 'General'),
-                            rule.get('tags', [])
-                        )
+        if record_tags:
+            for match_tag, result in zip(self._tag_rule_tags, self._tag_rule_results):
+                if match_tag in record_tags:
+                    return result
         
         return None
     
-    def _match_exact_merchant(self, record: TransactionRecord) -> Optional[Tuple[str, str, List[str]]]:
+    def _match_exact_merchant(self, merchant: str) -> Optional[Tuple[str, str, List[str]]]:
         """
         Try to match merchant name exactly.
         
         Args:
-            record: TransactionRecord to match
+            merchant: Merchant name to match
             
         Returns:
             Tuple of (category, subcategory, tags) if match found, None otherwise
         """
-        if not record.normalized_merchant and not record.payee:
-            return None
-        
-        merchant = record.normalized_merchant or record.payee
-        if not merchant:
-            return None
-        
         # Normalize for comparison (case-insensitive)
-        merchant_lower = merchant.lower().strip()
-        
-        for rule in self.rules.get('categories', []):
-            # Check exact matches
-            exact_merchants = rule.get('merchant_exact', [])
-            for exact_merchant in exact_merchants:
-                if merchant_lower == exact_merchant.lower().strip():
-                    return (
-                        rule.get('category'),
-                        rule.get('subcategory'),
-                        rule.get('tags', [])
-                    )
-        
-        return None
+        return self._exact_index.get(merchant.strip().casefold())
     
-    def _match_fuzzy_merchant(self, record: TransactionRecord) -> Optional[Tuple[str, str, List[str]]]:
+    def _match_fuzzy_merchant(self, merchant_lower: str) -> Optional[Tuple[str, str, List[str]]]:
         """
         Try to match merchant name using fuzzy matching.
         
         Args:
-            record: TransactionRecord to match
+            merchant_lower: Lowercased, stripped merchant name
             
         Returns:
             Tuple of (category, subcategory, tags) if match found, None otherwise
         """
-        if not record.normalized_merchant and not record.payee:
-            return None
-        
-        merchant = record.normalized_merchant or record.payee
-        if not merchant:
-            return None
-        
-        merchant_lower = merchant.lower().strip()
-        
         best_match = None
         best_score = 0
+        merchant_processed = _fuzzy_process(merchant_lower)
         
-        for rule in self.rules.get('categories', []):
-            # Check fuzzy matches
-            fuzzy_merchants = rule.get('merchant_fuzzy', [])
-            for fuzzy_merchant in fuzzy_merchants:
-                fuzzy_merchant_lower = fuzzy_merchant.lower().strip()
-                
-                # Use multiple fuzzy matching algorithms and take the best score
-                token_sort = fuzz.token_sort_ratio(merchant_lower, fuzzy_merchant_lower)
-                token_set = fuzz.token_set_ratio(merchant_lower, fuzzy_merchant_lower)
-                partial = fuzz.partial_ratio(merchant_lower, fuzzy_merchant_lower)
-                
-                # Take the maximum score from different algorithms
-                score = max(token_sort, token_set, partial)
-                
-                # Also check if fuzzy merchant is contained in the actual merchant
-                if fuzzy_merchant_lower in merchant_lower:
-                    score = max(score, 90)  # Boost score for substring match
-                
-                if score >= self.fuzzy_threshold and score > best_score:
-                    best_score = score
-                    best_match = (
-                        rule.get('category'),
-                        rule.get('subcategory'),
-                        rule.get('tags', [])
-                    )
+        for fuzzy_merchant_lower, fuzzy_merchant_processed, result in zip(
+            self._merchant_index, self._merchant_index_processed, self._merchant_results
+        ):
+            # Only a score reaching the threshold and the best so far can change
+            # the result; scorers give up early (returning 0) below this cutoff
+            cutoff = max(self.fuzzy_threshold, best_score)
+            
+            # Use multiple fuzzy matching algorithms and take the best score
+            score = max(
+                round(scorer(merchant_processed, fuzzy_merchant_processed, score_cutoff=_fuzzy_cutoff(cutoff)))
+                for scorer in _FUZZY_TOKEN_SCORERS
+            )
+            score = max(score, _partial_ratio(merchant_lower, fuzzy_merchant_lower, score_cutoff=cutoff))
+            
+            # Also check if fuzzy merchant is contained in the actual merchant
+            if fuzzy_merchant_lower in merchant_lower:
+                score = max(score, 90)  # Boost score for substring match
+            
+            if score >= self.fuzzy_threshold and score > best_score:
+                best_score = score
+                best_match = result
+                # Nothing can beat a perfect score
+                if best_score >= 100:
+                    break
         
         if best_match:
             self.logger.debug(f"Fuzzy match score: {best_score}")
         
         return best_match
     
-    def _match_keywords(self, record: TransactionRecord) -> Optional[Tuple[str, str, List[str]]]:
+    def _match_keywords(self, merchant: str, merchant_lower: str) -> Optional[Tuple[str, str, List[str]]]:
         """
         Try to match based on keywords in merchant/payee name.
         
         Checks both English and Arabic keywords.
         
         Args:
-            record: TransactionRecord to match
+            merchant: Merchant name, searched for Arabic keywords
+            merchant_lower: Lowercased, stripped merchant name, searched for
+                           English keywords
             
         Returns:
             Tuple of (category, subcategory, tags) if match found, None otherwise
         """
-        if not record.normalized_merchant and not record.payee:
-            return None
+        if self._keyword_automata is not None:
+            # One pass per automaton; the earliest rule with any keyword hit wins
+            english_automaton, arabic_automaton = self._keyword_automata
+            best_index = None
+            if english_automaton is not None:
+                for _, index in english_automaton.iter(merchant_lower):
+                    if best_index is None or index < best_index:
+                        best_index = index
+            if arabic_automaton is not None:
+                for _, index in arabic_automaton.iter(merchant):  # Arabic is case-sensitive
+                    if best_index is None or index < best_index:
+                        best_index = index
+            
+            return self._keyword_rules[best_index][2] if best_index is not None else None
         
-        merchant = record.normalized_merchant or record.payee
-        if not merchant:
+        english_prefilter, arabic_prefilter = self._keyword_prefilters
+        if not (
+            (english_prefilter is not None and english_prefilter.search(merchant_lower))
+            or (arabic_prefilter is not None and arabic_prefilter.search(merchant))
+        ):
             return None
         
-        merchant_lower = merchant.lower().strip()
-        
-        for rule in self.rules.get('categories', []):
-            keywords = rule.get('keywords', {})
-            
+        for english_keywords, arabic_keywords, result in self._keyword_rules:
             # Check English keywords
-            english_keywords = keywords.get('english', [])
             for keyword in english_keywords:
-                if keyword.lower() in merchant_lower:
-                    return (
-                        rule.get('category'),
-                        rule.get('subcategory'),
-                        rule.get('tags', [])
-                    )
+                if keyword in merchant_lower:
+                    return result
             
             # Check Arabic keywords
-            arabic_keywords = keywords.get('arabic', [])
             for keyword in arabic_keywords:
                 if keyword in merchant:  # Arabic is case-sensitive
-                    return (
-                        rule.get('category'),
-                        rule.get('subcategory'),
-                        rule.get('tags', [])
-                    )
+                    return result
         
         return None
     
@@ -519,27 +1146,20 @@ class Categorizer:
                 'uncategorized_percentage': 0.0
             }
         
+        # Counter tallies (category, subcategory) pairs in C and keeps
+        # first-seen order, so categories appear in the same order as before
+        pair_counts = Counter(
+            (record.category or 'Uncategorized', record.subcategory or 'General')
+            for record in records
+        )
+        
         category_counts = {}
-        uncategorized_count = 0
-        
-        for record in records:
-            category = record.category or 'Uncategorized'
-            if category == 'Uncategorized':
-                uncategorized_count += 1
-            
-            if category not in category_counts:
-                category_counts[category] = {
-                    'count': 0,
-                    'subcategories': {}
-                }
-            
-            category_counts[category]['count'] += 1
-            
-            # Count subcategories
-            subcategory = record.subcategory or 'General'
-            if subcategory not in category_counts[category]['subcategories']:
-                category_counts[category]['subcategories'][subcategory] = 0
-            category_counts[category]['subcategories'][subcategory] += 1
+        for (category, subcategory), count in pair_counts.items():
+            category_entry = category_counts.setdefault(category, {'count': 0, 'subcategories': {}})
+            category_entry['count'] += count
+            category_entry['subcategories'][subcategory] = count
+        
+        uncategorized_count = category_counts.get('Uncategorized', {}).get('count', 0)
         
         total_records = len(records)
         
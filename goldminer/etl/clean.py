@@ -1,9 +1,53 @@
 """Data cleaning module for handling duplicates and data quality."""
+import numpy as np
 import pandas as pd
 from typing import List, Optional, Dict, Any
+from pandas.api.types import is_string_dtype
 from goldminer.utils import setup_logger
 
 
+# Frames shorter than this are deduplicated with a Python set, which beats
+# drop_duplicates' per-call setup at this size
+_SMALL_FRAME_ROWS = 64
+
+
+def _clean_text(value: Any) -> str:
+    """
+    Clean a single present text value.
+    
+    Args:
+        value: Non-missing value to clean
+        
+    Returns:
+        Value as str with runs of whitespace collapsed to one space
+    """
+    if not isinstance(value, str):
+        value = str(value)
+    return ' '.join(value.split())
+
+
+def _has_plain_hashable_columns(df: pd.DataFrame) -> bool:
+    """
+    Check whether rows can be compared as plain Python tuples.
+    
+    True when every column is integer, boolean, or string typed without
+    missing values, so tuple equality agrees with drop_duplicates (which
+    treats missing values as equal to each other).
+    
+    Args:
+        df: Input DataFrame
+        
+    Returns:
+        True if row tuples hash and compare like pandas duplicates
+    """
+    for _, column in df.items():
+        if column.dtype.kind in 'iub':
+            continue
+        if not is_string_dtype(column.dtype) or column.hasnans:
+            return False
+    return True
+
+
 class DataCleaner:
     """Handles data cleaning including duplicate removal."""
     
@@ -34,7 +78,16 @@ class DataCleaner:
         """
         initial_rows = len(df)
         
-        df_clean = df.drop_duplicates(subset=subset, keep=keep)
+        if (subset is None and keep == 'first' and 0 < initial_rows < _SMALL_FRAME_ROWS
+                and len(df.columns) > 0 and _has_plain_hashable_columns(df)):
+            seen = set()
+            keep_mask = [
+                not (row in seen or seen.add(row))
+                for row in df.itertuples(index=False, name=None)
+            ]
+            df_clean = df[keep_mask]
+        else:
+            df_clean = df.drop_duplicates(subset=subset, keep=keep)
         
         removed_count = initial_rows - len(df_clean)
         if removed_count > 0:
@@ -105,32 +158,39 @@ class DataCleaner:
         Returns:
             DataFrame with outliers removed
         """
-        df_clean = df.copy()
-        initial_rows = len(df_clean)
+        initial_rows = len(df)
+        
+        # Each column's bounds come from the rows earlier columns kept, so the
+        # filters are combined in one row mask and the frame is cut only once
+        keep = np.ones(initial_rows, dtype=bool)
         
         for col in columns:
-            if col not in df_clean.columns:
+            if col not in df.columns:
                 continue
             
-            if not pd.api.types.is_numeric_dtype(df_clean[col]):
+            if not pd.api.types.is_numeric_dtype(df[col]):
                 self.logger.warning(f"Column {col} is not numeric, skipping outlier removal")
                 continue
             
+            values = df[col]
+            kept_values = values[keep]
+            
             if method == 'iqr':
-                Q1 = df_clean[col].quantile(0.25)
-                Q3 = df_clean[col].quantile(0.75)
+                Q1, Q3 = kept_values.quantile([0.25, 0.75])
                 IQR = Q3 - Q1
                 lower_bound = Q1 - threshold * IQR
                 upper_bound = Q3 + threshold * IQR
                 
-                mask = (df_clean[col] >= lower_bound) & (df_clean[col] <= upper_bound)
-                df_clean = df_clean[mask]
+                in_bounds = (values >= lower_bound) & (values <= upper_bound)
+                keep &= in_bounds.to_numpy(dtype=bool, na_value=False)
                 
             elif method == 'zscore':
-                mean = df_clean[col].mean()
-                std = df_clean[col].std()
-                z_scores = ((df_clean[col] - mean) / std).abs()
-                df_clean = df_clean[z_scores <= threshold]
+                mean = kept_values.mean()
+                std = kept_values.std()
+                z_scores = ((values - mean) / std).abs()
+                keep &= (z_scores <= threshold).to_numpy(dtype=bool, na_value=False)
+        
+        df_clean = df[keep]
         
         removed_count = initial_rows - len(df_clean)
         if removed_count > 0:
@@ -195,28 +255,9 @@ class DataCleaner:
             if col not in df_clean.columns:
                 continue
             
-            df_clean[col] = df_clean[col].apply(self._clean_text)
+            # map skips missing values itself, so only present values pay
+            # for the Python-level cleanup
+            df_clean[col] = df_clean[col].map(_clean_text, na_action='ignore')
             self.logger.debug(f"Cleaned text in column: {col}")
         
         return df_clean
-    
-    def _clean_text(self, value):
-        """
-        Clean a single text value.
-        
-        Args:
-            value: Text value to clean
-            
-        Returns:
-            Cleaned text value
-        """
-        if pd.isna(value):
-            return value
-        
-        if not isinstance(value, str):
-            value = str(value)
-        
-        # Remove extra whitespace
-        value = ' '.join(value.split())
-        
-        return value
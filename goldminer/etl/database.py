@@ -6,6 +6,11 @@ from typing import Optional, List, Dict, Any
 from goldminer.utils import setup_logger
 
 
+# Bound parameters allowed per statement by SQLite builds before 3.32; newer
+# builds allow more, so this is a safe ceiling for multi-row INSERTs
+_SQLITE_MAX_VARIABLES = 999
+
+
 class DatabaseManager:
     """Manages SQLite database operations."""
     
@@ -14,18 +19,25 @@ class DatabaseManager:
         Initialize database manager.
         
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, or ":memory:" for a
+                    private in-memory database
             config: Configuration manager instance
         """
         self.db_path = db_path
         self.config = config
         self.logger = setup_logger(__name__)
         
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # Ensure directory exists (":memory:" and bare file names have none)
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
         
         # Initialize connection
         self.connection = None
+        
+        # Table names from the last catalog scan, with the schema version
+        # they were read at
+        self._table_cache = None
     
     def connect(self):
         """Establish database connection."""
@@ -38,6 +50,7 @@ class DatabaseManager:
         if self.connection:
             self.connection.close()
             self.connection = None
+            self._table_cache = None
             self.logger.info("Disconnected from database")
     
     def __enter__(self):
@@ -63,7 +76,13 @@ class DatabaseManager:
         self.connect()
         
         try:
-            df.to_sql(table_name, self.connection, if_exists=if_exists, index=False)
+            # Multi-row INSERTs sized to stay under SQLite's parameter limit
+            # need far fewer statements than one INSERT per row
+            chunksize = max(1, _SQLITE_MAX_VARIABLES // max(1, len(df.columns)))
+            df.to_sql(
+                table_name, self.connection, if_exists=if_exists, index=False,
+                method='multi', chunksize=chunksize
+            )
             self.logger.info(f"Saved {len(df)} rows to table '{table_name}'")
         except Exception as e:
             self.logger.error(f"Error saving to database: {str(e)}")
@@ -130,10 +149,17 @@ class DatabaseManager:
         """
         self.connect()
         
-        query = "SELECT name FROM sqlite_master WHERE type='table'"
+        # SQLite bumps schema_version on every schema change, from this or any
+        # other connection, so an unchanged version means an unchanged catalog
         cursor = self.connection.cursor()
-        cursor.execute(query)
-        tables = [row[0] for row in cursor.fetchall()]
+        schema_version = cursor.execute("PRAGMA schema_version").fetchone()[0]
+        if self._table_cache is not None and self._table_cache[0] == schema_version:
+            tables = list(self._table_cache[1])
+        else:
+            query = "SELECT name FROM sqlite_master WHERE type='table'"
+            cursor.execute(query)
+            tables = [row[0] for row in cursor.fetchall()]
+            self._table_cache = (schema_version, tuple(tables))
         
         self.logger.info(f"Found {len(tables)} tables in database")
         return tables
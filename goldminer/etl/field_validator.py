@@ -4,13 +4,299 @@ FieldValidator module for enforcing typing, required fields, and validation logi
 This module provides Pydantic models for structured transaction data validation,
 ensuring data quality and consistency throughout the ETL pipeline.
 """
-from typing import Optional, List, Dict, Any
+import math
+import sys
+from enum import IntFlag
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Union
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
 from goldminer.utils import setup_logger
 
 
+# Valid currency codes (ISO 4217 common ones + Arabic currency names)
+_VALID_CURRENCIES = frozenset({
+    'EGP', 'USD', 'EUR', 'GBP', 'SAR', 'AED', 'KWD', 'QAR', 'BHD', 'OMR',
+    'JOD', 'LBP', 'IQD', 'SYP', 'YER', 'TND', 'MAD', 'DZD', 'SDG', 'LYD',
+    # Arabic currency names
+    'جنيه', 'دولار', 'يورو', 'ريال', 'درهم', 'دينار'
+})
+
+_VALID_CONFIDENCE_LEVELS = frozenset({'high', 'medium', 'low'})
+
+_VALID_TRANSACTION_STATES = frozenset({'MONETARY', 'PROMO', 'OTP', 'DECLINED', 'UNKNOWN'})
+
+# Common spellings of valid currency codes and confidence levels, mapped to
+# their interned canonical form so these skip the strip/case/intern calls
+_CANONICAL_CURRENCIES = {
+    spelling: sys.intern(code)
+    for code in _VALID_CURRENCIES
+    for spelling in (code, code.lower(), code.title())
+}
+_CANONICAL_CONFIDENCE_LEVELS = {
+    spelling: sys.intern(level)
+    for level in _VALID_CONFIDENCE_LEVELS
+    for spelling in (level, level.upper(), level.title())
+}
+
+
+class WarningFlag(IntFlag):
+    """
+    Kinds of warning ParsedTransaction adds during validation.
+    
+    Check for one with ParsedTransaction.has_warning rather than by searching
+    the warning messages.
+    """
+    AMOUNT_NOT_POSITIVE = 1
+    AMOUNT_INVALID = 2
+    AMOUNT_MISSING = 4
+    CURRENCY_INVALID = 8
+    CURRENCY_MISSING = 16
+    DATE_MALFORMED = 32
+    CARD_SUFFIX_INVALID = 64
+
+
+# Plain int values of the warning flags, for the validator's hot path
+_W_AMOUNT_NOT_POSITIVE = WarningFlag.AMOUNT_NOT_POSITIVE.value
+_W_INVALID_AMOUNT = WarningFlag.AMOUNT_INVALID.value
+_W_MISSING_AMOUNT = WarningFlag.AMOUNT_MISSING.value
+_W_INVALID_CURRENCY = WarningFlag.CURRENCY_INVALID.value
+_W_MISSING_CURRENCY = WarningFlag.CURRENCY_MISSING.value
+_W_MALFORMED_DATE = WarningFlag.DATE_MALFORMED.value
+_W_INVALID_CARD_SUFFIX = WarningFlag.CARD_SUFFIX_INVALID.value
+
+# Fixed warning messages, and the prefixes of messages quoting a value
+_WARNING_FLAG_BY_MESSAGE = {
+    "Amount must be positive": WarningFlag.AMOUNT_NOT_POSITIVE,
+    "Missing required field: amount": WarningFlag.AMOUNT_MISSING,
+    "Missing currency field": WarningFlag.CURRENCY_MISSING,
+}
+_WARNING_FLAG_BY_PREFIX = (
+    ("Invalid numeric format for amount: ", WarningFlag.AMOUNT_INVALID),
+    ("Invalid currency code: ", WarningFlag.CURRENCY_INVALID),
+    ("Malformed date: ", WarningFlag.DATE_MALFORMED),
+    ("Invalid card suffix (must be 4 digits): ", WarningFlag.CARD_SUFFIX_INVALID),
+)
+
+# Warnings that make confidence low on their own
+_CRITICAL_WARNINGS = _W_INVALID_AMOUNT | _W_MISSING_AMOUNT
+
+# Confidence level by number of warnings, capped at 2
+_CONFIDENCE_BY_WARNING_COUNT = ('high', 'medium', 'low')
+
+# strptime formats accepted for transaction dates
+_DATE_FORMATS = (
+    '%d/%m/%Y',
+    '%Y-%m-%d',
+    '%m/%d/%Y',
+    '%d-%m-%Y',
+    '%Y/%m/%d',
+    '%d.%m.%Y',
+    '%Y.%m.%d',
+    '%d %b %Y',
+    '%d %B %Y',
+    '%b %d, %Y',
+    '%B %d, %Y',
+)
+
+# Numeric date formats by (separator, whether the 4-digit year comes first).
+# A date can only match a numeric format if it contains that format's
+# separator, and %Y matches exactly 4 digits while %d and %m match at most 2,
+# so the separator's position tells the year-first formats from the rest.
+_NUMERIC_DATE_FORMATS = {
+    (sep, year_first): tuple(
+        fmt for fmt in _DATE_FORMATS
+        if sep in fmt and '%b' not in fmt and '%B' not in fmt
+        and fmt.startswith('%Y') == year_first
+    )
+    for sep in '/-.'
+    for year_first in (True, False)
+}
+
+# Formats with month names, which contain none of the numeric separators
+_NAMED_MONTH_DATE_FORMATS = tuple(
+    fmt for fmt in _DATE_FORMATS if '%b' in fmt or '%B' in fmt
+)
+
+# Input keys FieldValidator passes on to ParsedTransaction
+_MODEL_FIELDS = frozenset({
+    'amount', 'currency', 'date', 'payee', 'txn_type',
+    'card_suffix', 'bank_id', 'confidence', 'warnings',
+    'transaction_state', 'resolved_date', 'extracted_date_raw', 'text_repaired'
+})
+
+
+def _is_valid_numeric_date(date: str) -> Optional[bool]:
+    """
+    Check a date of three ASCII digit fields without calling strptime.
+    
+    Follows strptime's rules for the numeric formats in _DATE_FORMATS: %Y is
+    exactly 4 digits, %m and %d are 1 or 2 digits from 1-12 and 1-31, and the
+    result must be a real calendar date.
+    
+    Args:
+        date: Date string
+        
+    Returns:
+        Whether the date is valid, or None if it is not ASCII digits split
+        by two of the same '/', '-' or '.' separator
+    """
+    if not date.isascii():
+        return None
+    
+    for sep in '/-.':
+        fields = date.split(sep)
+        if len(fields) == 3:
+            break
+    else:
+        return None
+    
+    first, second, third = fields
+    if not (first.isdigit() and second.isdigit() and third.isdigit()):
+        return None
+    
+    # (year, month, day) for each numeric format using this separator
+    if len(first) == 4:
+        candidates = [(first, second, third)]
+    elif len(third) == 4:
+        candidates = [(third, second, first)]
+        if sep == '/':
+            candidates.append((third, first, second))
+    else:
+        return False
+    
+    for year, month, day in candidates:
+        if len(month) > 2 or len(day) > 2:
+            continue
+        try:
+            datetime(int(year), int(month), int(day))
+            return True
+        except ValueError:
+            continue
+    
+    return False
+
+
+def _is_valid_date(date: str) -> bool:
+    """
+    Check whether a date string matches any of the accepted formats.
+    
+    Only the formats the string's separators allow are tried, so a valid
+    date usually costs a single strptime call instead of up to eleven.
+    
+    Args:
+        date: Date string
+        
+    Returns:
+        True if some format in _DATE_FORMATS parses the date
+    """
+    valid = _is_valid_numeric_date(date)
+    if valid is not None:
+        return valid
+    
+    for sep in '/-.':
+        position = date.find(sep)
+        if position < 0:
+            continue
+        for fmt in _NUMERIC_DATE_FORMATS[sep, position == 4]:
+            try:
+                datetime.strptime(date, fmt)
+                return True
+            except ValueError:
+                continue
+    
+    for fmt in _NAMED_MONTH_DATE_FORMATS:
+        try:
+            datetime.strptime(date, fmt)
+            return True
+        except ValueError:
+            continue
+    
+    return False
+
+
+def _format_warnings(flags: int, transaction: 'ParsedTransaction') -> List[str]:
+    """
+    Build the warning messages for a set of warning flags.
+    
+    Args:
+        flags: Warning flags found by the model validator
+        transaction: Transaction the warnings are about
+        
+    Returns:
+        Warning messages, in the order the checks run
+    """
+    warnings = []
+    if flags & _W_AMOUNT_NOT_POSITIVE:
+        warnings.append("Amount must be positive")
+    if flags & _W_INVALID_AMOUNT:
+        warnings.append(f"Invalid numeric format for amount: {transaction.amount}")
+    if flags & _W_MISSING_AMOUNT:
+        warnings.append("Missing required field: amount")
+    if flags & _W_INVALID_CURRENCY:
+        warnings.append(f"Invalid currency code: {transaction.currency}")
+    if flags & _W_MISSING_CURRENCY:
+        warnings.append("Missing currency field")
+    if flags & _W_MALFORMED_DATE:
+        warnings.append(f"Malformed date: {transaction.date}")
+    if flags & _W_INVALID_CARD_SUFFIX:
+        warnings.append(f"Invalid card suffix (must be 4 digits): {transaction.card_suffix}")
+    return warnings
+
+
+def _warning_flags(warnings: List[str]) -> WarningFlag:
+    """
+    Get the warning flags a list of warning messages stands for.
+    
+    Args:
+        warnings: Warning messages
+        
+    Returns:
+        Flags of the recognized messages; other messages add none
+    """
+    flags = WarningFlag(0)
+    for warning in warnings:
+        flag = _WARNING_FLAG_BY_MESSAGE.get(warning)
+        if flag is None:
+            for prefix, prefix_flag in _WARNING_FLAG_BY_PREFIX:
+                if warning.startswith(prefix):
+                    flag = prefix_flag
+                    break
+            else:
+                continue
+        flags |= flag
+    return flags
+
+
+def _parse_amount(cleaned: str) -> Union[float, Decimal]:
+    """
+    Parse a cleaned amount string for validity and sign checks.
+    
+    float() parses the common case several times faster than Decimal. Any
+    string it accepts is also a valid Decimal, and a finite non-zero float has
+    the same sign as the Decimal. Zero (possibly an underflow), NaN, infinities
+    and strings float rejects are left to Decimal, so the outcome, including
+    InvalidOperation for NaN comparisons, is the same as Decimal(cleaned).
+    
+    Args:
+        cleaned: Amount with formatting removed
+        
+    Returns:
+        Parsed amount
+        
+    Raises:
+        InvalidOperation: If the string is not a number
+    """
+    try:
+        value = float(cleaned)
+    except ValueError:
+        return Decimal(cleaned)
+    if value and math.isfinite(value):
+        return value
+    return Decimal(cleaned)
+
+
 class ParsedTransaction(BaseModel):
     """
     Pydantic model for parsed transaction data with comprehensive validation.
@@ -44,10 +330,16 @@ class ParsedTransaction(BaseModel):
     extracted_date_raw: Optional[str] = Field(default=None, description="Raw extracted date string")
     text_repaired: bool = Field(default=False, description="Whether text repair was applied")
     
-    model_config = {
-        "validate_assignment": True,
-        "str_strip_whitespace": True,
-    }
+    # Only flat fields, so nothing to copy or revalidate: ParsedTransaction
+    # instances passed back in are used as-is, and unknown keys are dropped
+    # without building an extras dict. Assignments stay validated, as callers
+    # rely on the field validators when updating a transaction.
+    model_config = ConfigDict(
+        validate_assignment=True,
+        str_strip_whitespace=True,
+        extra='ignore',
+        revalidate_instances='never',
+    )
     
     @field_validator('amount')
     @classmethod
@@ -72,7 +364,7 @@ class ParsedTransaction(BaseModel):
         
         try:
             # Validate that it can be converted to decimal
-            Decimal(cleaned)
+            _parse_amount(cleaned)
             return cleaned
         except (InvalidOperation, ValueError):
             # Return original value and let warnings be added in model validator
@@ -93,27 +385,24 @@ class ParsedTransaction(BaseModel):
         if v is None or v == '':
             return None
         
-        v = v.strip().upper()
+        canonical = _CANONICAL_CURRENCIES.get(v)
+        if canonical is not None:
+            return canonical
         
-        # List of valid currency codes (ISO 4217 common ones + Arabic)
-        valid_currencies = {
-            'EGP', 'USD', 'EUR', 'GBP', 'SAR', 'AED', 'KWD', 'QAR', 'BHD', 'OMR',
-            'JOD', 'LBP', 'IQD', 'SYP', 'YER', 'TND', 'MAD', 'DZD', 'SDG', 'LYD',
-            # Arabic currency names
-            'جنيه', 'دولار', 'يورو', 'ريال', 'درهم', 'دينار'
-        }
+        v = v.strip().upper()
         
-        if v not in valid_currencies:
+        if v not in _VALID_CURRENCIES:
             # Return original and let warnings be added in model validator
             return v
         
-        return v
+        # Valid codes are a small fixed set, so every transaction shares one copy
+        return sys.intern(v)
     
     @field_validator('date')
     @classmethod
     def validate_date(cls, v: Optional[str]) -> Optional[str]:
         """
-        Validate date field - attempt to parse various date formats.
+        Validate date field - strip surrounding whitespace.
         
         Args:
             v: Date string to validate
@@ -124,32 +413,9 @@ class ParsedTransaction(BaseModel):
         if v is None or v == '':
             return None
         
-        v = v.strip()
-        
-        # Common date formats to try
-        date_formats = [
-            '%d/%m/%Y',
-            '%Y-%m-%d',
-            '%m/%d/%Y',
-            '%d-%m-%Y',
-            '%Y/%m/%d',
-            '%d.%m.%Y',
-            '%Y.%m.%d',
-            '%d %b %Y',
-            '%d %B %Y',
-            '%b %d, %Y',
-            '%B %d, %Y',
-        ]
-        
-        for fmt in date_formats:
-            try:
-                datetime.strptime(v, fmt)
-                return v  # Valid date
-            except ValueError:
-                continue
-        
-        # Return original and let warnings be added in model validator
-        return v
+        # Valid or not, the date is kept as given; the model validator
+        # checks it against the accepted formats and adds any warning
+        return v.strip()
     
     @field_validator('card_suffix')
     @classmethod
@@ -187,13 +453,16 @@ class ParsedTransaction(BaseModel):
         Returns:
             Validated confidence level
         """
+        canonical = _CANONICAL_CONFIDENCE_LEVELS.get(v)
+        if canonical is not None:
+            return canonical
+        
         v = v.lower().strip()
-        valid_levels = {'high', 'medium', 'low'}
         
-        if v not in valid_levels:
+        if v not in _VALID_CONFIDENCE_LEVELS:
             return 'low'
         
-        return v
+        return sys.intern(v)
 
     @field_validator('transaction_state')
     @classmethod
@@ -203,9 +472,52 @@ class ParsedTransaction(BaseModel):
         if v is None:
             return None
 
-        allowed = {'MONETARY', 'PROMO', 'OTP', 'DECLINED', 'UNKNOWN'}
         value = v.strip().upper()
-        return value if value in allowed else 'UNKNOWN'
+        return sys.intern(value) if value in _VALID_TRANSACTION_STATES else 'UNKNOWN'
+    
+    @field_validator('txn_type', 'bank_id')
+    @classmethod
+    def intern_vocabulary(cls, v: Optional[str]) -> Optional[str]:
+        """
+        Intern transaction types and bank identifiers.
+        
+        Both come from a small vocabulary ('POS', 'HSBC', ...), so interning
+        lets the many transactions holding them share one string each.
+        
+        Args:
+            v: Transaction type or bank identifier
+            
+        Returns:
+            The interned string, or None
+        """
+        if v is None:
+            return None
+        
+        return sys.intern(v)
+    
+    @property
+    def warning_flags(self) -> WarningFlag:
+        """Kinds of warning in the warnings list, as WarningFlag bits."""
+        return _warning_flags(self.warnings)
+    
+    def has_warning(self, flag: WarningFlag) -> bool:
+        """
+        Check whether the transaction has any of the given kinds of warning.
+        
+        Args:
+            flag: Warning kind, or several combined with |
+            
+        Returns:
+            True if any of the flags is set
+            
+        Examples:
+            >>> txn = ParsedTransaction(amount='abc', currency='EGP')
+            >>> txn.has_warning(WarningFlag.AMOUNT_INVALID)
+            True
+            >>> txn.has_warning(WarningFlag.CURRENCY_INVALID | WarningFlag.DATE_MALFORMED)
+            False
+        """
+        return bool(self.warning_flags & flag)
     
     @model_validator(mode='after')
     def validate_model_and_add_warnings(self) -> 'ParsedTransaction':
@@ -226,73 +538,51 @@ class ParsedTransaction(BaseModel):
         if len(self.warnings) > 0:
             return self
         
-        warnings = []
+        flags = 0
         
         # Check amount validity
         if self.amount is not None:
             try:
-                amount_val = Decimal(self.amount.replace(',', '').replace(' ', ''))
+                amount_val = _parse_amount(self.amount.replace(',', '').replace(' ', ''))
                 if amount_val <= 0:
-                    warnings.append("Amount must be positive")
+                    flags |= _W_AMOUNT_NOT_POSITIVE
             except (InvalidOperation, ValueError, AttributeError):
-                warnings.append(f"Invalid numeric format for amount: {self.amount}")
+                flags |= _W_INVALID_AMOUNT
         else:
-            warnings.append("Missing required field: amount")
+            flags |= _W_MISSING_AMOUNT
         
         # Check currency validity
         if self.currency is not None:
-            valid_currencies = {
-                'EGP', 'USD', 'EUR', 'GBP', 'SAR', 'AED', 'KWD', 'QAR', 'BHD', 'OMR',
-                'JOD', 'LBP', 'IQD', 'SYP', 'YER', 'TND', 'MAD', 'DZD', 'SDG', 'LYD',
-                'جنيه', 'دولار', 'يورو', 'ريال', 'درهم', 'دينار'
-            }
-            if self.currency.upper() not in valid_currencies and self.currency not in valid_currencies:
-                warnings.append(f"Invalid currency code: {self.currency}")
+            if self.currency.upper() not in _VALID_CURRENCIES and self.currency not in _VALID_CURRENCIES:
+                flags |= _W_INVALID_CURRENCY
         else:
-            warnings.append("Missing currency field")
+            flags |= _W_MISSING_CURRENCY
         
         # Check date validity
         if self.date is not None:
-            date_formats = [
-                '%d/%m/%Y', '%Y-%m-%d', '%m/%d/%Y', '%d-%m-%Y', '%Y/%m/%d',
-                '%d.%m.%Y', '%Y.%m.%d', '%d %b %Y', '%d %B %Y', '%b %d, %Y', '%B %d, %Y',
-            ]
-            valid_date = False
-            for fmt in date_formats:
-                try:
-                    datetime.strptime(self.date, fmt)
-                    valid_date = True
-                    break
-                except ValueError:
-                    continue
-            
-            if not valid_date:
-                warnings.append(f"Malformed date: {self.date}")
+            if not _is_valid_date(self.date):
+                flags |= _W_MALFORMED_DATE
         
         # Check card suffix validity
         if self.card_suffix is not None:
             if not (self.card_suffix.isdigit() and len(self.card_suffix) == 4):
-                warnings.append(f"Invalid card suffix (must be 4 digits): {self.card_suffix}")
+                flags |= _W_INVALID_CARD_SUFFIX
+        
+        # Warning messages are only formatted once the checks found problems
+        warnings = _format_warnings(flags, self) if flags else []
         
         # Directly update warnings using object.__setattr__ to avoid validation recursion
         object.__setattr__(self, 'warnings', warnings)
         
-        # Update confidence based on critical field failures
-        critical_fields_missing = any(
-            'Missing required field' in w or 'Invalid numeric format' in w 
-            for w in warnings
-        )
-        
-        new_confidence = self.confidence
-        if critical_fields_missing or len(warnings) >= 2:
-            # Low confidence if missing critical fields or 2+ warnings
+        # Update confidence from the warning count; a failed critical field
+        # makes it low regardless
+        new_confidence = _CONFIDENCE_BY_WARNING_COUNT[min(len(warnings), 2)]
+        if flags & _CRITICAL_WARNINGS:
             new_confidence = 'low'
-        elif len(warnings) > 0:
-            # Medium confidence if any warnings
-            new_confidence = 'medium'
-        elif self.amount and self.currency and self.date:
+        elif not flags and not (self.amount and self.currency and self.date):
             # High confidence only if all key fields present and valid
-            new_confidence = 'high'
+            # (a missing date is not warned about)
+            new_confidence = self.confidence
         
         # Directly update confidence using object.__setattr__ to avoid validation recursion
         object.__setattr__(self, 'confidence', new_confidence)
@@ -300,6 +590,87 @@ class ParsedTransaction(BaseModel):
         return self
 
 
+# Most transactions validated by a FieldValidator kept for reuse
+_MEMO_SIZE = 4096
+
+# Input value types that can key the memo: equal values of these types are
+# interchangeable, unlike floats (0.0 and -0.0 are equal but print differently)
+_MEMO_VALUE_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def _memo_key(data: Dict[str, Any]) -> Optional[tuple]:
+    """
+    Build the memo key for a transaction dict.
+    
+    Args:
+        data: Dictionary containing parsed transaction fields
+        
+    Returns:
+        Tuple of (key, value type, value) items, or None if a value's type
+        cannot key the memo
+    """
+    key = []
+    for field, value in data.items():
+        value_type = value.__class__
+        if value_type not in _MEMO_VALUE_TYPES:
+            return None
+        key.append((field, value_type, value))
+    return tuple(key)
+
+
+def _copy_transaction(transaction: ParsedTransaction) -> ParsedTransaction:
+    """
+    Copy a transaction so the copy can be changed independently.
+    
+    Args:
+        transaction: Transaction to copy
+        
+    Returns:
+        Copy with its own warnings list
+    """
+    copied = transaction.model_copy()
+    object.__setattr__(copied, 'warnings', list(transaction.warnings))
+    return copied
+
+
+@lru_cache(maxsize=None)
+def _batch_adapter() -> TypeAdapter:
+    """
+    Get the adapter that validates a whole list of transaction dicts at once.
+    
+    Building a TypeAdapter is expensive, so it is built on the first batch
+    rather than at import, and reused after that.
+    
+    Returns:
+        TypeAdapter for List[ParsedTransaction]
+    """
+    return TypeAdapter(List[ParsedTransaction])
+
+
+def _normalize_input(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map field name aliases and drop keys that are not model fields.
+    
+    Args:
+        data: Dictionary containing parsed transaction fields
+        
+    Returns:
+        New dictionary with only ParsedTransaction fields
+    """
+    normalized_data = data.copy()
+    
+    # transaction_type -> txn_type
+    if 'transaction_type' in normalized_data and 'txn_type' not in normalized_data:
+        normalized_data['txn_type'] = normalized_data.pop('transaction_type')
+    
+    # matched_bank -> bank_id
+    if 'matched_bank' in normalized_data and 'bank_id' not in normalized_data:
+        normalized_data['bank_id'] = normalized_data.pop('matched_bank')
+    
+    # Remove extra fields that aren't part of the model
+    return {k: v for k, v in normalized_data.items() if k in _MODEL_FIELDS}
+
+
 class FieldValidator:
     """
     Field validation manager that validates parsed SMS transaction data.
@@ -312,6 +683,9 @@ class FieldValidator:
     def __init__(self):
         """Initialize the FieldValidator."""
         self.logger = setup_logger(__name__)
+        
+        # Validated transactions by input, oldest first; callers get copies
+        self._memo: Dict[tuple, ParsedTransaction] = {}
     
     def validate(self, data: Dict[str, Any]) -> ParsedTransaction:
         """
@@ -321,6 +695,9 @@ class FieldValidator:
         it catches all errors, logs them, and returns a structured object
         with appropriate warnings.
         
+        Inputs seen before, with only string, integer, boolean or None
+        values, return a copy of the earlier result without revalidating.
+        
         Args:
             data: Dictionary containing parsed transaction fields
             
@@ -337,36 +714,25 @@ class FieldValidator:
             '100.50'
         """
         try:
-            # Handle field name aliases
-            normalized_data = data.copy()
-            
-            # transaction_type -> txn_type
-            if 'transaction_type' in normalized_data and 'txn_type' not in normalized_data:
-                normalized_data['txn_type'] = normalized_data.pop('transaction_type')
+            memo_key = _memo_key(data)
+            if memo_key is not None:
+                cached = self._memo.get(memo_key)
+                if cached is not None:
+                    self._log_result(cached)
+                    return _copy_transaction(cached)
             
-            # matched_bank -> bank_id
-            if 'matched_bank' in normalized_data and 'bank_id' not in normalized_data:
-                normalized_data['bank_id'] = normalized_data.pop('matched_bank')
-            
-            # Remove extra fields that aren't part of the model
-            allowed_fields = {
-                'amount', 'currency', 'date', 'payee', 'txn_type',
-                'card_suffix', 'bank_id', 'confidence', 'warnings',
-                'transaction_state', 'resolved_date', 'extracted_date_raw', 'text_repaired'
-            }
-            normalized_data = {k: v for k, v in normalized_data.items() if k in allowed_fields}
+            # Handle field name aliases and drop fields outside the model
+            normalized_data = _normalize_input(data)
             
             # Create ParsedTransaction with validation
             transaction = ParsedTransaction(**normalized_data)
             
-            # Log validation result
-            if transaction.warnings:
-                self.logger.warning(
-                    f"Transaction validation completed with warnings: {transaction.warnings}"
-                )
-            else:
-                self.logger.info("Transaction validation successful")
+            if memo_key is not None:
+                if len(self._memo) >= _MEMO_SIZE:
+                    del self._memo[next(iter(self._memo))]
+                self._memo[memo_key] = _copy_transaction(transaction)
             
+            self._log_result(transaction)
             return transaction
             
         except Exception as e:
@@ -414,6 +780,20 @@ class FieldValidator:
                     warnings=[f"Critical validation exception: {str(e)}"]
                 )
     
+    def _log_result(self, transaction: ParsedTransaction) -> None:
+        """
+        Log the outcome of validating one transaction.
+        
+        Args:
+            transaction: Validated transaction
+        """
+        if transaction.warnings:
+            self.logger.warning(
+                f"Transaction validation completed with warnings: {transaction.warnings}"
+            )
+        else:
+            self.logger.info("Transaction validation successful")
+    
     def validate_batch(self, data_list: List[Dict[str, Any]]) -> List[ParsedTransaction]:
         """
         Validate a batch of parsed transaction data.
@@ -434,6 +814,21 @@ class FieldValidator:
             >>> len(results)
             2
         """
+        # Validate the whole batch in one pydantic call. If any item fails, fall
+        # back to validating item by item, which recovers from each failure.
+        try:
+            results = _batch_adapter().validate_python(
+                [_normalize_input(data) for data in data_list]
+            )
+        except Exception:
+            results = None
+        
+        if results is not None:
+            for result in results:
+                self._log_result(result)
+            self.logger.info(f"Validated batch of {len(data_list)} transactions")
+            return results
+        
         results = []
         
         for i, data in enumerate(data_list):
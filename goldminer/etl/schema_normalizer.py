@@ -9,6 +9,7 @@ from typing import Optional, List, Dict, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
+import sys
 import unicodedata
 import uuid
 from goldminer.utils import setup_logger
@@ -16,7 +17,12 @@ from goldminer.etl.field_validator import ParsedTransaction
 from goldminer.analysis.card_classifier import CardClassifier
 
 
-@dataclass
+# Records are created in bulk, so drop the per-instance __dict__ where the
+# interpreter supports slotted dataclasses (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class TransactionRecord:
     """
     Unified internal schema for normalized transaction data.
@@ -5,53 +5,115 @@ import os
 import yaml
 from goldminer.analysis import BankPatternRecognizer
 
+try:
+    from yaml import CSafeDumper
+except ImportError:
+    from yaml import SafeDumper as CSafeDumper
+
+
+TEST_PATTERNS = {
+    'HSBC': [
+        'HSBC',
+        'Your HSBC card',
+        'HSBC Egypt'
+    ],
+    'CIB': [
+        'CIB',
+        'بطاقتك من CIB',
+        'Commercial International Bank'
+    ],
+    'NBE': [
+        'NBE',
+        'National Bank of Egypt',
+        'البنك الأهلي'
+    ],
+    'QNB': [
+        'QNB',
+        'QNB ALAHLI',
+        'بنك قطر'
+    ]
+}
+
+# The fixture is identical for every test, so serialize it once at import time
+_PATTERNS_YAML = yaml.dump(TEST_PATTERNS, allow_unicode=True, Dumper=CSafeDumper).encode('utf-8')
+
+# Expected bank IDs
+_HSBC = 'HSBC'
+_CIB = 'CIB'
+_NBE = 'NBE'
+_QNB = 'QNB'
+_UNK = 'unknown_bank'
+
+# Keep fixture files in RAM (tmpfs) when available
+_TMP_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
 
 class TestBankPatternRecognizer(unittest.TestCase):
     """Test cases for BankPatternRecognizer class."""
     
+    BATCH_SAMPLES = (
+        "HSBC card transaction",
+        "CIB balance alert",
+        "NBE withdrawal",
+        "Unknown bank message"
+    )
+    BATCH_EXPECTED = (_HSBC, _CIB, _NBE, _UNK)
+    
+    STATS_SAMPLES = (
+        "HSBC transaction 1",
+        "HSBC transaction 2",
+        "CIB alert",
+        "NBE withdrawal",
+        "Unknown message"
+    )
+    
+    # Real-world style messages
+    REAL_WORLD_SAMPLES = (
+        ("Dear customer, Your HSBC card ending 1234 was charged 250.00 EGP", _HSBC),
+        ("CIB: Your account balance is 5000 EGP", _CIB),
+        ("NBE - Transaction alert: Withdrawal of 1000 EGP", _NBE),
+        ("QNB ALAHLI: Purchase approved", _QNB),
+        ("Your transaction has been processed", _UNK),
+    )
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build a recognizer shared by tests that never mutate it."""
+        cls._tmp = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
+        cls.temp_dir = cls._tmp.name
+        shared_patterns_file = os.path.join(cls.temp_dir, 'test_patterns.yaml')
+        with open(shared_patterns_file, 'wb') as f:
+            f.write(_PATTERNS_YAML)
+        
+        cls._shared_recognizer = BankPatternRecognizer(patterns_file=shared_patterns_file)
+        
+        cls.invalid_file = os.path.join(cls.temp_dir, 'invalid.yaml')
+        with open(cls.invalid_file, 'w') as f:
+            f.write("invalid: yaml: content: [[[")
+        
+        cls.empty_file = os.path.join(cls.temp_dir, 'empty.yaml')
+        with open(cls.empty_file, 'w') as f:
+            f.write("")
+        
+        # The production patterns file is parsed once per class, not per test
+        cls._default = BankPatternRecognizer()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up shared fixtures."""
+        cls._tmp.cleanup()
+    
     def setUp(self):
         """Set up test fixtures."""
-        # Create a temporary patterns file for testing
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_patterns_file = os.path.join(self.temp_dir, 'test_patterns.yaml')
-        
-        # Define test patterns
-        test_patterns = {
-            'HSBC': [
-                'HSBC',
-                'Your HSBC card',
-                'HSBC Egypt'
-            ],
-            'CIB': [
-                'CIB',
-                'بطاقتك من CIB',
-                'Commercial International Bank'
-            ],
-            'NBE': [
-                'NBE',
-                'National Bank of Egypt',
-                'البنك الأهلي'
-            ],
-            'QNB': [
-                'QNB',
-                'QNB ALAHLI',
-                'بنك قطر'
-            ]
-        }
+        # Per-test patterns file, so tests that rewrite it stay isolated
+        self.test_patterns_file = os.path.join(self.temp_dir, f'{self._testMethodName}.yaml')
         
-        # Write patterns to file
-        with open(self.test_patterns_file, 'w', encoding='utf-8') as f:
-            yaml.dump(test_patterns, f, allow_unicode=True)
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        with open(self.test_patterns_file, 'wb') as f:
+            f.write(_PATTERNS_YAML)
     
     def test_initialization_default(self):
         """Test initialization with default patterns file."""
-        recognizer = BankPatternRecognizer()
+        recognizer = self._default
         self.assertIsNotNone(recognizer.bank_patterns)
         self.assertGreater(len(recognizer.bank_patterns), 0)
         self.assertEqual(recognizer.fuzzy_threshold, 80)
@@ -61,8 +123,8 @@ class TestBankPatternRecognizer(unittest.TestCase):
         """Test initialization with custom patterns file."""
         recognizer = BankPatternRecognizer(patterns_file=self.test_patterns_file)
         self.assertEqual(len(recognizer.bank_patterns), 4)
-        self.assertIn('HSBC', recognizer.bank_patterns)
-        self.assertIn('CIB', recognizer.bank_patterns)
+        self.assertIn(_HSBC, recognizer.bank_patterns)
+        self.assertIn(_CIB, recognizer.bank_patterns)
     
     def test_initialization_invalid_file(self):
         """Test initialization with non-existent file."""
@@ -77,57 +139,58 @@ class TestBankPatternRecognizer(unittest.TestCase):
         )
         self.assertEqual(recognizer.fuzzy_threshold, 90)
     
-    def test_exact_match_hsbc(self):
-        """Test exact pattern matching for HSBC."""
-        recognizer = BankPatternRecognizer(patterns_file=self.test_patterns_file)
-        
-        # Test various HSBC patterns
-        self.assertEqual(recognizer.identify_bank("Your HSBC card ending 1234 was charged"), 'HSBC')
-        self.assertEqual(recognizer.identify_bank("HSBC Egypt transaction alert"), 'HSBC')
-        self.assertEqual(recognizer.identify_bank("Message from HSBC Bank"), 'HSBC')
-    
-    def test_exact_match_cib(self):
-        """Test exact pattern matching for CIB."""
-        recognizer = BankPatternRecognizer(patterns_file=self.test_patterns_file)
-        
-        self.assertEqual(recognizer.identify_bank("CIB: Your balance is 1000 EGP"), 'CIB')
-        self.assertEqual(recognizer.identify_bank("Commercial International Bank alert"), 'CIB')
+    EXACT_MATCH_CASES = (
+        (_HSBC, (
+            "Your HSBC card ending 1234 was charged",
+            "HSBC Egypt transaction alert",
+            "Message from HSBC Bank",
+        )),
+        (_CIB, (
+            "CIB: Your balance is 1000 EGP",
+            "Commercial International Bank alert",
+            "تم الخصم من بطاقتك من CIB",
+        )),
+        (_NBE, (
+            "البنك الأهلي - تنبيه",
+        )),
+    )
     
-    def test_exact_match_arabic(self):
-        """Test exact pattern matching with Arabic text."""
-        recognizer = BankPatternRecognizer(patterns_file=self.test_patterns_file)
-        
-        # Test Arabic patterns
-        self.assertEqual(recognizer.identify_bank("تم الخصم من بطاقتك من CIB"), 'CIB')
-        self.assertEqual(recognizer.identify_bank("البنك الأهلي - تنبيه"), 'NBE')
+    def test_exact_matches_parameterized(self):
+        """Test exact pattern matching for English and Arabic patterns."""
+        recognizer = self._shared_recognizer
+        
+        for bank, messages in self.EXACT_MATCH_CASES:
+            for sms in messages:
+                with self.subTest(bank=bank, sms=sms):
+                    self.assertEqual(recognizer.identify_bank(sms), bank)
     
     def test_case_insensitive_matching(self):
         """Test case-insensitive pattern matching."""
-        recognizer = BankPatternRecognizer(patterns_file=self.test_patterns_file)
+        recognizer = self._shared_recognizer
         
-        self.assertEqual(recognizer.identify_bank("hsbc card transaction"), 'HSBC')
-        self.assertEqual(recognizer.identify_bank("HSBC Card Transaction"), 'HSBC')
-        self.assertEqual(recognizer.identify_bank("HsBc CaRd TrAnSaCtIoN"), 'HSBC')
+        self.assertEqual(recognizer.identify_bank("hsbc card transaction"), _HSBC)
+        self.assertEqual(recognizer.identify_bank("HSBC Card Transaction"), _HSBC)
+        self.assertEqual(recognizer.identify_bank("HsBc CaRd TrAnSaCtIoN"), _HSBC)
     
     def test_no_match_returns_unknown(self):
         """Test that unmatched SMS returns 'unknown_bank'."""
-        recognizer = BankPatternRecognizer(patterns_file=self.test_patterns_file)
+        recognizer = self._shared_recognizer
         
-        self.assertEqual(recognizer.identify_bank("Random text message"), 'unknown_bank')
-        self.assertEqual(recognizer.identify_bank("Some unknown bank alert"), 'unknown_bank')
+        self.assertEqual(recognizer.identify_bank("Random text message"), _UNK)
+        self.assertEqual(recognizer.identify_bank("Some unknown bank alert"), _UNK)
     
     def test_empty_sms(self):
         """Test handling of empty SMS."""
-        recognizer = BankPatternRecognizer(patterns_file=self.test_patterns_file)
+        recognizer = self._shared_recognizer
         
-        self.assertEqual(recognizer.identify_bank(""), 'unknown_bank')
-        self.assertEqual(recognizer.identify_bank("   "), 'unknown_bank')
+        self.assertEqual(recognizer.identify_bank(""), _UNK)
+        self.assertEqual(recognizer.identify_bank("   "), _UNK)
     
     def test_none_sms(self):
         """Test handling of None SMS."""
-        recognizer = BankPatternRecognizer(patterns_file=self.test_patterns_file)
+        recognizer = self._shared_recognizer
         
-        self.assertEqual(recognizer.identify_bank(None), 'unknown_bank')
+        self.assertEqual(recognizer.identify_bank(None), _UNK)
     
     def test_fuzzy_matching_enabled(self):
         """Test fuzzy matching when enabled."""
@@ -140,7 +203,7 @@ class TestBankPatternRecognizer(unittest.TestCase):
         # Test with slight variations/typos
         result = recognizer.identify_bank("Your HSBC crad was used")  # typo: crad
         # Should still match HSBC due to fuzzy matching
-        self.assertIn(result, ['HSBC', 'unknown_bank'])  # May or may not match depending on threshold
+        self.assertIn(result, [_HSBC, _UNK])  # May or may not match depending on threshold
     
     def test_fuzzy_matching_disabled(self):
         """Test that fuzzy matching can be disabled."""
@@ -156,40 +219,30 @@ class TestBankPatternRecognizer(unittest.TestCase):
     
     def test_return_confidence(self):
         """Test returning confidence scores."""
-        recognizer = BankPatternRecognizer(patterns_file=self.test_patterns_file)
+        recognizer = self._shared_recognizer
         
         # Exact match should return confidence of 100
         bank, confidence = recognizer.identify_bank("HSBC transaction", return_confidence=True)
-        self.assertEqual(bank, 'HSBC')
+        self.assertEqual(bank, _HSBC)
         self.assertEqual(confidence, 100)
         
         # Unknown bank should return confidence of 0
         bank, confidence = recognizer.identify_bank("Unknown message", return_confidence=True)
-        self.assertEqual(bank, 'unknown_bank')
+        self.assertEqual(bank, _UNK)
         self.assertEqual(confidence, 0)
     
     def test_identify_banks_batch(self):
         """Test batch processing of multiple SMS messages."""
-        recognizer = BankPatternRecognizer(patterns_file=self.test_patterns_file)
+        recognizer = self._shared_recognizer
         
-        messages = [
-            "HSBC card transaction",
-            "CIB balance alert",
-            "NBE withdrawal",
-            "Unknown bank message"
-        ]
-        
-        results = recognizer.identify_banks_batch(messages)
+        results = recognizer.identify_banks_batch(self.BATCH_SAMPLES)
         
         self.assertEqual(len(results), 4)
-        self.assertEqual(results[0], 'HSBC')
-        self.assertEqual(results[1], 'CIB')
-        self.assertEqual(results[2], 'NBE')
-        self.assertEqual(results[3], 'unknown_bank')
+        self.assertEqual(tuple(results), self.BATCH_EXPECTED)
     
     def test_identify_banks_batch_with_confidence(self):
         """Test batch processing with confidence scores."""
-        recognizer = BankPatternRecognizer(patterns_file=self.test_patterns_file)
+        recognizer = self._shared_recognizer
         
         messages = [
             "HSBC transaction",
@@ -199,29 +252,21 @@ class TestBankPatternRecognizer(unittest.TestCase):
         results = recognizer.identify_banks_batch(messages, return_confidence=True)
         
         self.assertEqual(len(results), 2)
-        self.assertEqual(results[0][0], 'HSBC')
+        self.assertEqual(results[0][0], _HSBC)
         self.assertEqual(results[0][1], 100)
-        self.assertEqual(results[1][0], 'unknown_bank')
+        self.assertEqual(results[1][0], _UNK)
         self.assertEqual(results[1][1], 0)
     
     def test_get_bank_statistics(self):
         """Test getting bank statistics from SMS list."""
-        recognizer = BankPatternRecognizer(patterns_file=self.test_patterns_file)
+        recognizer = self._shared_recognizer
         
-        messages = [
-            "HSBC transaction 1",
-            "HSBC transaction 2",
-            "CIB alert",
-            "NBE withdrawal",
-            "Unknown message"
-        ]
-        
-        stats = recognizer.get_bank_statistics(messages)
+        stats = recognizer.get_bank_statistics(self.STATS_SAMPLES)
         
-        self.assertEqual(stats['HSBC'], 2)
-        self.assertEqual(stats['CIB'], 1)
-        self.assertEqual(stats['NBE'], 1)
-        self.assertEqual(stats['unknown_bank'], 1)
+        self.assertEqual(stats[_HSBC], 2)
+        self.assertEqual(stats[_CIB], 1)
+        self.assertEqual(stats[_NBE], 1)
+        self.assertEqual(stats[_UNK], 1)
     
     def test_reload_patterns(self):
         """Test reloading patterns from file."""
@@ -237,7 +282,7 @@ class TestBankPatternRecognizer(unittest.TestCase):
         }
         
         with open(self.test_patterns_file, 'w', encoding='utf-8') as f:
-            yaml.dump(new_patterns, f)
+            yaml.dump(new_patterns, f, Dumper=CSafeDumper)
         
         # Reload patterns
         recognizer.reload_patterns()
@@ -247,12 +292,12 @@ class TestBankPatternRecognizer(unittest.TestCase):
     
     def test_multiple_banks_first_match_wins(self):
         """Test that first matching bank is returned when multiple could match."""
-        recognizer = BankPatternRecognizer(patterns_file=self.test_patterns_file)
+        recognizer = self._shared_recognizer
         
         # SMS that could potentially match multiple banks (though unlikely in practice)
         result = recognizer.identify_bank("HSBC and CIB transaction")
         # Should return the first one found
-        self.assertIn(result, ['HSBC', 'CIB'])
+        self.assertIn(result, [_HSBC, _CIB])
     
     def test_regex_special_characters(self):
         """Test handling of regex special characters in patterns."""
@@ -267,7 +312,7 @@ class TestBankPatternRecognizer(unittest.TestCase):
         
         temp_file = os.path.join(self.temp_dir, 'special_patterns.yaml')
         with open(temp_file, 'w', encoding='utf-8') as f:
-            yaml.dump(special_patterns, f)
+            yaml.dump(special_patterns, f, Dumper=CSafeDumper)
         
         recognizer = BankPatternRecognizer(patterns_file=temp_file)
         
@@ -277,15 +322,15 @@ class TestBankPatternRecognizer(unittest.TestCase):
     
     def test_whitespace_handling(self):
         """Test proper handling of whitespace in SMS."""
-        recognizer = BankPatternRecognizer(patterns_file=self.test_patterns_file)
+        recognizer = self._shared_recognizer
         
         # SMS with extra whitespace
-        self.assertEqual(recognizer.identify_bank("  HSBC  transaction  "), 'HSBC')
-        self.assertEqual(recognizer.identify_bank("\nHSBC\ntransaction\n"), 'HSBC')
+        self.assertEqual(recognizer.identify_bank("  HSBC  transaction  "), _HSBC)
+        self.assertEqual(recognizer.identify_bank("\nHSBC\ntransaction\n"), _HSBC)
     
     def test_long_sms_message(self):
         """Test handling of long SMS messages."""
-        recognizer = BankPatternRecognizer(patterns_file=self.test_patterns_file)
+        recognizer = self._shared_recognizer
         
         long_sms = (
             "This is a very long SMS message with lots of text. "
@@ -295,30 +340,23 @@ class TestBankPatternRecognizer(unittest.TestCase):
             "Thank you for using our services."
         )
         
-        self.assertEqual(recognizer.identify_bank(long_sms), 'HSBC')
+        self.assertEqual(recognizer.identify_bank(long_sms), _HSBC)
     
     def test_mixed_language_sms(self):
         """Test SMS with mixed English and Arabic."""
-        recognizer = BankPatternRecognizer(patterns_file=self.test_patterns_file)
+        recognizer = self._shared_recognizer
         
         mixed_sms = "Dear customer, بطاقتك من CIB was charged 100 EGP"
-        self.assertEqual(recognizer.identify_bank(mixed_sms), 'CIB')
+        self.assertEqual(recognizer.identify_bank(mixed_sms), _CIB)
     
     def test_detection_accuracy_real_world_samples(self):
         """Test detection accuracy with real-world-like SMS samples."""
-        recognizer = BankPatternRecognizer(patterns_file=self.test_patterns_file)
+        recognizer = self._shared_recognizer
         
-        # Real-world style messages
-        samples = [
-            ("Dear customer, Your HSBC card ending 1234 was charged 250.00 EGP", 'HSBC'),
-            ("CIB: Your account balance is 5000 EGP", 'CIB'),
-            ("NBE - Transaction alert: Withdrawal of 1000 EGP", 'NBE'),
-            ("QNB ALAHLI: Purchase approved", 'QNB'),
-            ("Your transaction has been processed", 'unknown_bank'),
-        ]
+        results = recognizer.identify_banks_batch([sms for sms, _ in self.REAL_WORLD_SAMPLES])
+        self.assertEqual(len(results), len(self.REAL_WORLD_SAMPLES))
         
-        for sms, expected_bank in samples:
-            result = recognizer.identify_bank(sms)
+        for (sms, expected_bank), result in zip(self.REAL_WORLD_SAMPLES, results):
             self.assertEqual(
                 result,
                 expected_bank,
@@ -327,21 +365,13 @@ class TestBankPatternRecognizer(unittest.TestCase):
     
     def test_invalid_yaml_file(self):
         """Test handling of invalid YAML file."""
-        invalid_file = os.path.join(self.temp_dir, 'invalid.yaml')
-        with open(invalid_file, 'w') as f:
-            f.write("invalid: yaml: content: [[[")
-        
         with self.assertRaises(ValueError):
-            BankPatternRecognizer(patterns_file=invalid_file)
+            BankPatternRecognizer(patterns_file=self.invalid_file)
     
     def test_empty_patterns_file(self):
         """Test handling of empty patterns file."""
-        empty_file = os.path.join(self.temp_dir, 'empty.yaml')
-        with open(empty_file, 'w') as f:
-            f.write("")
-        
         with self.assertRaises(ValueError):
-            BankPatternRecognizer(patterns_file=empty_file)
+            BankPatternRecognizer(patterns_file=self.empty_file)
 
 
 if __name__ == '__main__':
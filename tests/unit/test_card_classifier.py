@@ -1,57 +1,109 @@
 """Unit tests for CardClassifier."""
-import unittest
-import tempfile
+import copy
 import os
-import yaml
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
 from goldminer.analysis import CardClassifier
+from goldminer.analysis import card_classifier
+
+
+TEST_ACCOUNTS = {
+    '1234': {
+        'account_id': 'ACC-TEST-001',
+        'account_type': 'Credit',
+        'interest_rate': 19.99,
+        'credit_limit': 50000.00,
+        'billing_cycle': 15,
+        'label': 'Test Credit Card'
+    },
+    '5678': {
+        'account_id': 'ACC-TEST-002',
+        'account_type': 'Debit',
+        'interest_rate': None,
+        'credit_limit': None,
+        'billing_cycle': None,
+        'label': 'Test Debit Card'
+    },
+    '9012': {
+        'account_id': 'ACC-TEST-003',
+        'account_type': 'Prepaid',
+        'interest_rate': None,
+        'credit_limit': None,
+        'billing_cycle': None,
+        'label': 'Test Prepaid Card'
+    }
+}
+
+# YAML form of TEST_ACCOUNTS, written verbatim by tests that load from a file
+FIXTURE_YAML = """\
+'1234':
+  account_id: ACC-TEST-001
+  account_type: Credit
+  interest_rate: 19.99
+  credit_limit: 50000.0
+  billing_cycle: 15
+  label: Test Credit Card
+'5678':
+  account_id: ACC-TEST-002
+  account_type: Debit
+  interest_rate: null
+  credit_limit: null
+  billing_cycle: null
+  label: Test Debit Card
+'9012':
+  account_id: ACC-TEST-003
+  account_type: Prepaid
+  interest_rate: null
+  credit_limit: null
+  billing_cycle: null
+  label: Test Prepaid Card
+"""
+
+NEW_ACCOUNTS_YAML = """\
+'1111':
+  account_id: ACC-NEW-001
+  account_type: Credit
+  interest_rate: 20.0
+  credit_limit: 10000.0
+  billing_cycle: 1
+  label: New Account
+"""
+
+# Static fixtures that never change between runs (invalid.yaml, missing_field.yaml)
+_FIXTURES_DIR = Path(__file__).parent.parent / 'fixtures'
+
+# Keep fixture files in RAM (tmpfs) when available
+_TMP_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Built once per test module and only ever read by tests
+_CLASSIFIER = CardClassifier(accounts=copy.deepcopy(TEST_ACCOUNTS))
 
 
 class TestCardClassifier(unittest.TestCase):
     """Test cases for CardClassifier class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create a temporary accounts file for testing
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_accounts_file = os.path.join(self.temp_dir, 'test_accounts.yaml')
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by all tests."""
+        # Accounts are injected directly; only file-loading tests touch the filesystem
+        cls.classifier = _CLASSIFIER
         
-        # Define test account data
-        test_accounts = {
-            '1234': {
-                'account_id': 'ACC-TEST-001',
-                'account_type': 'Credit',
-                'interest_rate': 19.99,
-                'credit_limit': 50000.00,
-                'billing_cycle': 15,
-                'label': 'Test Credit Card'
-            },
-            '5678': {
-                'account_id': 'ACC-TEST-002',
-                'account_type': 'Debit',
-                'interest_rate': None,
-                'credit_limit': None,
-                'billing_cycle': None,
-                'label': 'Test Debit Card'
-            },
-            '9012': {
-                'account_id': 'ACC-TEST-003',
-                'account_type': 'Prepaid',
-                'interest_rate': None,
-                'credit_limit': None,
-                'billing_cycle': None,
-                'label': 'Test Prepaid Card'
-            }
-        }
-        
-        # Write accounts to file
-        with open(self.test_accounts_file, 'w', encoding='utf-8') as f:
-            yaml.dump(test_accounts, f, allow_unicode=True)
+        # One directory for the whole class; file names are made unique per test
+        cls._tmp = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
+        cls.addClassCleanup(cls._tmp.cleanup)
+        cls.temp_dir = Path(cls._tmp.name)
+    
+    def _temp_path(self, name):
+        """Return a path in the class temporary directory unique to the current test."""
+        return self.temp_dir / f'{self._testMethodName}_{name}'
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+    def _write_accounts_file(self, yaml_text, name='test_accounts.yaml'):
+        """Write YAML text to a temporary accounts file and return its path."""
+        accounts_file = self._temp_path(name)
+        accounts_file.write_text(yaml_text, encoding='utf-8')
+        return accounts_file
     
     # Test initialization
     
@@ -63,160 +115,46 @@ class TestCardClassifier(unittest.TestCase):
     
     def test_initialization_custom_file(self):
         """Test initialization with custom accounts file."""
-        classifier = CardClassifier(accounts_file=self.test_accounts_file)
+        classifier = CardClassifier(accounts_file=self._write_accounts_file(FIXTURE_YAML))
         self.assertEqual(len(classifier.accounts), 3)
         self.assertIn('1234', classifier.accounts)
         self.assertIn('5678', classifier.accounts)
+        self.assertEqual(classifier.accounts, TEST_ACCOUNTS)
     
     def test_initialization_missing_file(self):
         """Test initialization with non-existent file returns empty dict."""
-        non_existent_file = os.path.join(self.temp_dir, 'nonexistent.yaml')
+        non_existent_file = self._temp_path('nonexistent.yaml')
         classifier = CardClassifier(accounts_file=non_existent_file)
         self.assertEqual(len(classifier.accounts), 0)
     
     def test_initialization_invalid_yaml(self):
         """Test initialization with invalid YAML."""
-        invalid_file = os.path.join(self.temp_dir, 'invalid.yaml')
-        with open(invalid_file, 'w') as f:
-            f.write("invalid: yaml: content: [")
+        invalid_file = _FIXTURES_DIR / 'invalid.yaml'
         
         with self.assertRaises(ValueError):
             CardClassifier(accounts_file=invalid_file)
     
     def test_initialization_missing_required_field(self):
         """Test initialization with account missing required field."""
-        invalid_accounts = {
-            '1111': {
-                'account_type': 'Credit',
-                # Missing account_id
-            }
-        }
-        invalid_file = os.path.join(self.temp_dir, 'invalid_accounts.yaml')
-        with open(invalid_file, 'w', encoding='utf-8') as f:
-            yaml.dump(invalid_accounts, f)
+        invalid_file = _FIXTURES_DIR / 'missing_field.yaml'
         
         with self.assertRaises(ValueError):
             CardClassifier(accounts_file=invalid_file)
     
-    # Test extract_card_suffix
-    
-    def test_extract_card_suffix_english_ending(self):
-        """Test extraction with English 'ending' pattern."""
-        suffix = CardClassifier.extract_card_suffix("Transaction on card ending 1234")
-        self.assertEqual(suffix, "1234")
-    
-    def test_extract_card_suffix_english_card_ending(self):
-        """Test extraction with English 'card ending' pattern."""
-        suffix = CardClassifier.extract_card_suffix("HSBC card ending 5678 charged")
-        self.assertEqual(suffix, "5678")
-    
-    def test_extract_card_suffix_english_card_number(self):
-        """Test extraction with English 'card' pattern."""
-        suffix = CardClassifier.extract_card_suffix("HSBC card 9012 charged 100 EGP")
-        self.assertEqual(suffix, "9012")
-    
-    def test_extract_card_suffix_english_asterisks(self):
-        """Test extraction with asterisks pattern."""
-        suffix = CardClassifier.extract_card_suffix("Card **1234 used")
-        self.assertEqual(suffix, "1234")
-        
-        suffix = CardClassifier.extract_card_suffix("Card ****5678 used")
-        self.assertEqual(suffix, "5678")
-    
-    def test_extract_card_suffix_arabic_raqm(self):
-        """Test extraction with Arabic 'رقم' pattern."""
-        suffix = CardClassifier.extract_card_suffix("بطاقة رقم 1234")
-        self.assertEqual(suffix, "1234")
-    
-    def test_extract_card_suffix_arabic_bitaqa(self):
-        """Test extraction with Arabic 'بطاقة' pattern."""
-        suffix = CardClassifier.extract_card_suffix("بطاقة 5678 خصم")
-        self.assertEqual(suffix, "5678")
-    
-    def test_extract_card_suffix_arabic_indic_numerals(self):
-        """Test extraction with Arabic-Indic numerals."""
-        suffix = CardClassifier.extract_card_suffix("بطاقة رقم ١٢٣٤")
-        self.assertEqual(suffix, "1234")
-        
-        suffix = CardClassifier.extract_card_suffix("رقم ٥٦٧٨")
-        self.assertEqual(suffix, "5678")
-    
-    def test_extract_card_suffix_mixed_language(self):
-        """Test extraction with mixed English and Arabic."""
-        suffix = CardClassifier.extract_card_suffix("HSBC بطاقة رقم 9012")
-        self.assertEqual(suffix, "9012")
-    
-    def test_extract_card_suffix_case_insensitive(self):
-        """Test that extraction is case-insensitive."""
-        suffix1 = CardClassifier.extract_card_suffix("Card Ending 1234")
-        suffix2 = CardClassifier.extract_card_suffix("CARD ENDING 1234")
-        suffix3 = CardClassifier.extract_card_suffix("card ending 1234")
-        
-        self.assertEqual(suffix1, "1234")
-        self.assertEqual(suffix2, "1234")
-        self.assertEqual(suffix3, "1234")
-    
-    def test_extract_card_suffix_none_if_not_found(self):
-        """Test that None is returned when no suffix is found."""
-        suffix = CardClassifier.extract_card_suffix("No card info here")
-        self.assertIsNone(suffix)
-        
-        suffix = CardClassifier.extract_card_suffix("Transaction completed")
-        self.assertIsNone(suffix)
-    
-    def test_extract_card_suffix_invalid_length(self):
-        """Test that suffixes with wrong length are rejected."""
-        # Too short
-        suffix = CardClassifier.extract_card_suffix("card ending 123")
-        self.assertIsNone(suffix)
+    def test_initialization_accounts_mapping(self):
+        """Test initialization with an in-memory accounts mapping."""
+        classifier = CardClassifier(accounts=copy.deepcopy(TEST_ACCOUNTS))
+        self.assertEqual(len(classifier.accounts), 3)
+        self.assertEqual(classifier.lookup_account('1234')['account_id'], 'ACC-TEST-001')
         
-        # Too long
-        suffix = CardClassifier.extract_card_suffix("card ending 12345")
-        self.assertIsNone(suffix)
-    
-    def test_extract_card_suffix_empty_input(self):
-        """Test extraction with empty or invalid input."""
-        self.assertIsNone(CardClassifier.extract_card_suffix(""))
-        self.assertIsNone(CardClassifier.extract_card_suffix(None))
-    
-    def test_extract_card_suffix_multiple_matches(self):
-        """Test that first valid match is returned."""
-        suffix = CardClassifier.extract_card_suffix("card ending 1234 and card 5678")
-        # Should return the first match
-        self.assertEqual(suffix, "1234")
-    
-    # Test convert_arabic_indic_numerals
-    
-    def test_convert_arabic_indic_numerals_basic(self):
-        """Test basic Arabic-Indic numeral conversion."""
-        result = CardClassifier.convert_arabic_indic_numerals("١٢٣٤")
-        self.assertEqual(result, "1234")
-    
-    def test_convert_arabic_indic_numerals_all_digits(self):
-        """Test conversion of all Arabic-Indic digits."""
-        result = CardClassifier.convert_arabic_indic_numerals("٠١٢٣٤٥٦٧٨٩")
-        self.assertEqual(result, "0123456789")
-    
-    def test_convert_arabic_indic_numerals_in_text(self):
-        """Test conversion in Arabic text."""
-        result = CardClassifier.convert_arabic_indic_numerals("بطاقة رقم ١٢٣٤")
-        self.assertEqual(result, "بطاقة رقم 1234")
-    
-    def test_convert_arabic_indic_numerals_mixed(self):
-        """Test conversion with mixed numerals."""
-        result = CardClassifier.convert_arabic_indic_numerals("12 and ٣٤")
-        self.assertEqual(result, "12 and 34")
-    
-    def test_convert_arabic_indic_numerals_empty(self):
-        """Test conversion with empty input."""
-        self.assertEqual(CardClassifier.convert_arabic_indic_numerals(""), "")
-        self.assertIsNone(CardClassifier.convert_arabic_indic_numerals(None))
+        with self.assertRaises(ValueError):
+            CardClassifier(accounts={'1111': {'account_type': 'Credit'}})
     
     # Test lookup_account
     
     def test_lookup_account_known_suffix(self):
         """Test lookup with known card suffix."""
-        classifier = CardClassifier(accounts_file=self.test_accounts_file)
+        classifier = self.classifier
         result = classifier.lookup_account("1234")
         
         self.assertEqual(result['account_id'], 'ACC-TEST-001')
@@ -226,7 +164,7 @@ class TestCardClassifier(unittest.TestCase):
     
     def test_lookup_account_unknown_suffix(self):
         """Test lookup with unknown card suffix."""
-        classifier = CardClassifier(accounts_file=self.test_accounts_file)
+        classifier = self.classifier
         result = classifier.lookup_account("9999")
         
         self.assertEqual(result['account_id'], 'unknown_9999')
@@ -236,29 +174,38 @@ class TestCardClassifier(unittest.TestCase):
     
     def test_lookup_account_empty_suffix(self):
         """Test lookup with empty suffix."""
-        classifier = CardClassifier(accounts_file=self.test_accounts_file)
+        classifier = self.classifier
         result = classifier.lookup_account("")
         
         self.assertEqual(result['account_id'], 'unknown')
         self.assertFalse(result['is_known'])
     
+    def test_lookup_account_returns_independent_copies(self):
+        """Test that mutating a lookup result does not affect later lookups."""
+        classifier = self.classifier
+        first = classifier.lookup_account("1234")
+        first['label'] = 'Modified'
+        
+        second = classifier.lookup_account("1234")
+        self.assertIsNot(first, second)
+        self.assertEqual(second['label'], TEST_ACCOUNTS['1234']['label'])
+    
     def test_lookup_account_includes_all_fields(self):
         """Test that lookup includes all expected fields."""
-        classifier = CardClassifier(accounts_file=self.test_accounts_file)
+        classifier = self.classifier
         result = classifier.lookup_account("1234")
         
-        expected_fields = [
+        expected_fields = {
             'account_id', 'account_type', 'interest_rate',
             'credit_limit', 'billing_cycle', 'label',
             'card_suffix', 'is_known'
-        ]
+        }
         
-        for field in expected_fields:
-            self.assertIn(field, result)
+        self.assertEqual(expected_fields - result.keys(), set())
     
     def test_lookup_account_credit_card(self):
         """Test lookup for credit card account."""
-        classifier = CardClassifier(accounts_file=self.test_accounts_file)
+        classifier = self.classifier
         result = classifier.lookup_account("1234")
         
         self.assertEqual(result['account_type'], 'Credit')
@@ -268,7 +215,7 @@ class TestCardClassifier(unittest.TestCase):
     
     def test_lookup_account_debit_card(self):
         """Test lookup for debit card account."""
-        classifier = CardClassifier(accounts_file=self.test_accounts_file)
+        classifier = self.classifier
         result = classifier.lookup_account("5678")
         
         self.assertEqual(result['account_type'], 'Debit')
@@ -277,7 +224,7 @@ class TestCardClassifier(unittest.TestCase):
     
     def test_lookup_account_prepaid_card(self):
         """Test lookup for prepaid card account."""
-        classifier = CardClassifier(accounts_file=self.test_accounts_file)
+        classifier = self.classifier
         result = classifier.lookup_account("9012")
         
         self.assertEqual(result['account_type'], 'Prepaid')
@@ -288,7 +235,7 @@ class TestCardClassifier(unittest.TestCase):
     
     def test_classify_sms_with_known_card(self):
         """Test SMS classification with known card."""
-        classifier = CardClassifier(accounts_file=self.test_accounts_file)
+        classifier = self.classifier
         result = classifier.classify_sms("Transaction on card ending 1234")
         
         self.assertEqual(result['account_id'], 'ACC-TEST-001')
@@ -296,7 +243,7 @@ class TestCardClassifier(unittest.TestCase):
     
     def test_classify_sms_with_unknown_card(self):
         """Test SMS classification with unknown card."""
-        classifier = CardClassifier(accounts_file=self.test_accounts_file)
+        classifier = self.classifier
         result = classifier.classify_sms("Transaction on card ending 9999")
         
         self.assertFalse(result['is_known'])
@@ -304,7 +251,7 @@ class TestCardClassifier(unittest.TestCase):
     
     def test_classify_sms_no_card_suffix(self):
         """Test SMS classification when no card suffix found."""
-        classifier = CardClassifier(accounts_file=self.test_accounts_file)
+        classifier = self.classifier
         result = classifier.classify_sms("Generic transaction message")
         
         self.assertFalse(result['is_known'])
@@ -313,7 +260,7 @@ class TestCardClassifier(unittest.TestCase):
     
     def test_classify_sms_arabic(self):
         """Test SMS classification with Arabic text."""
-        classifier = CardClassifier(accounts_file=self.test_accounts_file)
+        classifier = self.classifier
         result = classifier.classify_sms("خصم من بطاقة رقم ١٢٣٤")
         
         self.assertEqual(result['account_id'], 'ACC-TEST-001')
@@ -323,7 +270,7 @@ class TestCardClassifier(unittest.TestCase):
     
     def test_reload_accounts_same_file(self):
         """Test reloading accounts from same file."""
-        classifier = CardClassifier(accounts_file=self.test_accounts_file)
+        classifier = CardClassifier(accounts_file=self._write_accounts_file(FIXTURE_YAML))
         initial_count = len(classifier.accounts)
         
         classifier.reload_accounts()
@@ -332,23 +279,11 @@ class TestCardClassifier(unittest.TestCase):
     
     def test_reload_accounts_different_file(self):
         """Test reloading accounts from different file."""
-        classifier = CardClassifier(accounts_file=self.test_accounts_file)
+        classifier = CardClassifier(accounts_file=self._write_accounts_file(FIXTURE_YAML))
         self.assertEqual(len(classifier.accounts), 3)
         
         # Create a new file with different accounts
-        new_file = os.path.join(self.temp_dir, 'new_accounts.yaml')
-        new_accounts = {
-            '1111': {
-                'account_id': 'ACC-NEW-001',
-                'account_type': 'Credit',
-                'interest_rate': 20.0,
-                'credit_limit': 10000.0,
-                'billing_cycle': 1,
-                'label': 'New Account'
-            }
-        }
-        with open(new_file, 'w', encoding='utf-8') as f:
-            yaml.dump(new_accounts, f)
+        new_file = self._write_accounts_file(NEW_ACCOUNTS_YAML, 'new_accounts.yaml')
         
         classifier.reload_accounts(accounts_file=new_file)
         
@@ -359,7 +294,7 @@ class TestCardClassifier(unittest.TestCase):
     
     def test_full_workflow_english(self):
         """Test complete workflow with English SMS."""
-        classifier = CardClassifier(accounts_file=self.test_accounts_file)
+        classifier = self.classifier
         
         sms = "HSBC: Transaction of 100.00 EGP at Amazon on card ending 1234 on 15/11/2025"
         result = classifier.classify_sms(sms)
@@ -371,7 +306,7 @@ class TestCardClassifier(unittest.TestCase):
     
     def test_full_workflow_arabic(self):
         """Test complete workflow with Arabic SMS."""
-        classifier = CardClassifier(accounts_file=self.test_accounts_file)
+        classifier = self.classifier
         
         sms = "خصم مبلغ ١٠٠ جنيه من بطاقة رقم ٥٦٧٨"
         result = classifier.classify_sms(sms)
@@ -382,7 +317,7 @@ class TestCardClassifier(unittest.TestCase):
     
     def test_full_workflow_unknown_card(self):
         """Test complete workflow with unknown card."""
-        classifier = CardClassifier(accounts_file=self.test_accounts_file)
+        classifier = self.classifier
         
         sms = "Transaction on card ending 8888"
         result = classifier.classify_sms(sms)
@@ -392,5 +327,121 @@ class TestCardClassifier(unittest.TestCase):
         self.assertEqual(result['account_type'], 'Unknown')
 
 
+class TestCardClassifierStatic(unittest.TestCase):
+    """Test cases for CardClassifier static helpers, which need no accounts fixture."""
+    
+    # Test extract_card_suffix
+    
+    EXTRACT_CARD_SUFFIX_CASES = (
+        # English 'ending' / 'card ending' patterns
+        ("Transaction on card ending 1234", "1234"),
+        ("HSBC card ending 5678 charged", "5678"),
+        # English 'card' pattern
+        ("HSBC card 9012 charged 100 EGP", "9012"),
+        # Asterisks
+        ("Card **1234 used", "1234"),
+        ("Card ****5678 used", "5678"),
+        # Arabic 'رقم' and 'بطاقة' patterns
+        ("بطاقة رقم 1234", "1234"),
+        ("بطاقة 5678 خصم", "5678"),
+        # Arabic-Indic numerals
+        ("بطاقة رقم ١٢٣٤", "1234"),
+        ("رقم ٥٦٧٨", "5678"),
+        # Extended Arabic-Indic numerals
+        ("بطاقة رقم ۱۲۳۴", "1234"),
+        # Mixed English and Arabic
+        ("HSBC بطاقة رقم 9012", "9012"),
+        # Case-insensitive
+        ("Card Ending 1234", "1234"),
+        ("CARD ENDING 1234", "1234"),
+        ("card ending 1234", "1234"),
+        # No suffix present
+        ("No card info here", None),
+        ("Transaction completed", None),
+        # Wrong length: too short, too long
+        ("card ending 123", None),
+        ("card ending 12345", None),
+        # Empty or invalid input
+        ("", None),
+        (None, None),
+        # First valid match is returned
+        ("card ending 1234 and card 5678", "1234"),
+        # A higher-priority pattern wins over an earlier lower-priority match
+        ("Paid with **9999 on card ending 1234", "1234"),
+        ("Card 12345 then card 6789", "6789"),
+    )
+    
+    # Regex backends as the RE2 patterns extraction uses; None selects the
+    # fused re alternation
+    CARD_SUFFIX_BACKENDS = (
+        ('re', None),
+        ('re2', card_classifier._compile_card_suffix_re2()),
+    )
+    
+    def test_extract_card_suffix_table(self):
+        """Test card suffix extraction across English, Arabic and invalid inputs."""
+        for backend, re2_patterns in self.CARD_SUFFIX_BACKENDS:
+            with self.subTest(backend=backend):
+                if backend == 're2' and re2_patterns is None:
+                    self.skipTest("google-re2 is not installed")
+                
+                # Results memoized under another backend must not leak in
+                CardClassifier._extract_card_suffix_cached.cache_clear()
+                self.addCleanup(CardClassifier._extract_card_suffix_cached.cache_clear)
+                
+                with patch.object(card_classifier, '_CARD_SUFFIX_RE2', re2_patterns):
+                    for text, expected in self.EXTRACT_CARD_SUFFIX_CASES:
+                        with self.subTest(backend=backend, text=text):
+                            self.assertEqual(CardClassifier.extract_card_suffix(text), expected)
+    
+    def test_extract_card_suffix_memoized(self):
+        """Test that repeated SMS texts are served from the extraction cache."""
+        sms = "Memoized card ending 4321 alert"
+        first = CardClassifier.extract_card_suffix(sms)
+        hits = CardClassifier._extract_card_suffix_cached.cache_info().hits
+        
+        self.assertEqual(CardClassifier.extract_card_suffix(sms), first)
+        self.assertEqual(CardClassifier._extract_card_suffix_cached.cache_info().hits, hits + 1)
+    
+    def test_extract_card_suffix_prefilter_skips_cache(self):
+        """Test that SMS without trigger words never reach the extraction cache."""
+        misses = CardClassifier._extract_card_suffix_cached.cache_info().misses
+        
+        self.assertIsNone(CardClassifier.extract_card_suffix("Transaction completed 1234"))
+        self.assertEqual(CardClassifier._extract_card_suffix_cached.cache_info().misses, misses)
+    
+    # Test convert_arabic_indic_numerals
+    
+    def test_convert_arabic_indic_numerals_basic(self):
+        """Test basic Arabic-Indic numeral conversion."""
+        result = CardClassifier.convert_arabic_indic_numerals("١٢٣٤")
+        self.assertEqual(result, "1234")
+    
+    def test_convert_arabic_indic_numerals_all_digits(self):
+        """Test conversion of all Arabic-Indic digits."""
+        result = CardClassifier.convert_arabic_indic_numerals("٠١٢٣٤٥٦٧٨٩")
+        self.assertEqual(result, "0123456789")
+    
+    def test_convert_arabic_indic_numerals_in_text(self):
+        """Test conversion in Arabic text."""
+        result = CardClassifier.convert_arabic_indic_numerals("بطاقة رقم ١٢٣٤")
+        self.assertEqual(result, "بطاقة رقم 1234")
+    
+    def test_convert_arabic_indic_numerals_mixed(self):
+        """Test conversion with mixed numerals."""
+        result = CardClassifier.convert_arabic_indic_numerals("12 and ٣٤")
+        self.assertEqual(result, "12 and 34")
+    
+    def test_convert_arabic_indic_numerals_extended(self):
+        """Test conversion of Extended Arabic-Indic digits."""
+        result = CardClassifier.convert_arabic_indic_numerals("۰۱۲۳۴۵۶۷۸۹")
+        self.assertEqual(result, "0123456789")
+    
+    def test_convert_arabic_indic_numerals_empty(self):
+        """Test conversion with empty input."""
+        self.assertEqual(CardClassifier.convert_arabic_indic_numerals(""), "")
+        self.assertIsNone(CardClassifier.convert_arabic_indic_numerals(None))
+
+
 if __name__ == '__main__':
     unittest.main()
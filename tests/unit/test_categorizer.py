@@ -1,6 +1,8 @@
 """Unit tests for Categorizer."""
+import os
 import unittest
 import tempfile
+from unittest.mock import patch
 from pathlib import Path
 from goldminer.etl import Categorizer, TransactionRecord
 
@@ -121,6 +123,50 @@ class TestCategorizer(unittest.TestCase):
         # Should fallback to uncategorized
         self.assertEqual(result.category, 'Uncategorized')
     
+    def test_fuzzy_merchant_score_threshold_boundary(self):
+        """Test that fuzzy scores are fuzzywuzzy's integer scores."""
+        # "cab" scores at most 67 ("cafe" first, then "carrefur", whose
+        # partial_ratio would be 80 with windows overhanging the alias)
+        for threshold, expected in [
+            (67, ('Food & Dining', 'Restaurants')),
+            (68, ('Transportation', 'Ride Share')),
+            (80, ('Transportation', 'Ride Share')),
+        ]:
+            categorizer = Categorizer(fuzzy_threshold=threshold)
+            result = categorizer.categorize(
+                TransactionRecord(id='test-cab', payee="cab", normalized_merchant="cab")
+            )
+            categories, subcategories, _ = categorizer.categorize_columns(["cab"])
+            
+            self.assertEqual((result.category, result.subcategory), expected, threshold)
+            self.assertEqual((categories[0], subcategories[0]), expected, threshold)
+    
+    def test_fuzzy_merchant_contained_alias_scores_below_100(self):
+        """Test that a contained alias gets the substring boost, not a perfect score."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False, encoding='utf-8') as f:
+            f.write("""
+categories:
+  - category: "Transportation"
+    subcategory: "Public Transport"
+    merchant_fuzzy:
+      - "metro"
+""")
+            temp_file = f.name
+        
+        try:
+            # "metro" scores 80 against the name it is contained in, boosted to 90
+            for threshold, expected in [(90, 'Transportation'), (91, 'Uncategorized')]:
+                categorizer = Categorizer(rules_path=temp_file, fuzzy_threshold=threshold)
+                result = categorizer.categorize(
+                    TransactionRecord(id='test-metro', payee="mtemetromotro", normalized_merchant="mtemetromotro")
+                )
+                categories, _, _ = categorizer.categorize_columns(["mtemetromotro"])
+                
+                self.assertEqual(result.category, expected, threshold)
+                self.assertEqual(categories[0], expected, threshold)
+        finally:
+            Path(temp_file).unlink()
+    
     def test_keyword_match_english(self):
         """Test keyword matching with English keywords."""
         record = TransactionRecord(
@@ -257,6 +303,105 @@ class TestCategorizer(unittest.TestCase):
         self.assertEqual(results[2].category, 'Transportation')
         self.assertEqual(results[3].category, 'Uncategorized')
     
+    def test_categorize_batch_multiple_scoring_threads_preserves_order(self):
+        """Test that a batch fuzzy-scored on several cdist threads keeps input order."""
+        merchants = ["McDonald's", "Carrefour", "Uber", "Unknown"]
+        records = [
+            TransactionRecord(id=str(i), payee=merchants[i % 4], normalized_merchant=merchants[i % 4])
+            for i in range(300)
+        ]
+        
+        results = self.categorizer.categorize_batch(records, workers=4)
+        
+        self.assertEqual([r.id for r in results], [str(i) for i in range(300)])
+        expected = ['Food & Dining', 'Food & Dining', 'Transportation', 'Uncategorized']
+        self.assertEqual([r.category for r in results], expected * 75)
+    
+    def test_categorize_columns(self):
+        """Test column-wise categorization of merchant names."""
+        categories, subcategories, tags = self.categorizer.categorize_columns(
+            ["McDonald's", "Uber", "Unknown", None]
+        )
+        
+        self.assertEqual(categories, ['Food & Dining', 'Transportation', 'Uncategorized', 'Uncategorized'])
+        self.assertEqual(len(subcategories), 4)
+        self.assertEqual(len(tags), 4)
+        self.assertEqual(subcategories[0], 'Restaurants')
+    
+    def test_categorize_columns_returns_tag_copies(self):
+        """Test that changing returned tags does not change the rules."""
+        _, _, tags = self.categorizer.categorize_columns(["McDonald's", "Unknown"])
+        tags[0].append('Injected')
+        tags[1].append('Injected')
+        
+        _, _, tags = self.categorizer.categorize_columns(["McDonald's", "Unknown"])
+        self.assertNotIn('Injected', tags[0])
+        self.assertNotIn('Injected', tags[1])
+        
+        record = self.categorizer.categorize(
+            TransactionRecord(id='1', payee="McDonald's", normalized_merchant="McDonald's")
+        )
+        self.assertNotIn('Injected', record.tags)
+    
+    def test_categorize_columns_matches_categorize(self):
+        """Test that batched fuzzy scoring agrees with single-record matching."""
+        merchants = ["McDonalds Cairo", "Uber Trip", "Carrefour Maadi", "Vodafone Cash", "Qwerty"]
+        
+        categories, subcategories, _ = self.categorizer.categorize_columns(merchants)
+        
+        for merchant, category, subcategory in zip(merchants, categories, subcategories):
+            record = self.categorizer.categorize(
+                TransactionRecord(id='1', payee=merchant, normalized_merchant=merchant)
+            )
+            self.assertEqual((category, subcategory), (record.category, record.subcategory))
+    
+    def test_categorize_columns_survives_fuzzy_errors(self):
+        """Test that fuzzy-stage errors only affect the entries they belong to."""
+        merchants = ["McDonalds Cairo", "Carrefour Maadi", "Broken Merchant", "McDonald's"]
+        match_fuzzy_merchant = self.categorizer._match_fuzzy_merchant
+        
+        def failing_match(merchant_lower):
+            if merchant_lower == 'broken merchant':
+                raise ValueError("scorer failure")
+            return match_fuzzy_merchant(merchant_lower)
+        
+        with patch.object(self.categorizer, '_match_fuzzy_merchants', side_effect=RuntimeError("cdist failure")), \
+                patch.object(self.categorizer, '_match_fuzzy_merchant', side_effect=failing_match):
+            categories, subcategories, _ = self.categorizer.categorize_columns(merchants)
+        
+        self.assertEqual(
+            list(zip(categories, subcategories)),
+            [('Food & Dining', 'Restaurants'), ('Food & Dining', 'Groceries'),
+             ('Uncategorized', 'General'), ('Food & Dining', 'Restaurants')]
+        )
+    
+    def test_repeated_merchant_served_from_cache(self):
+        """Test that repeated merchants reuse the memoized lookup."""
+        first = self.categorizer.categorize(
+            TransactionRecord(id='1', payee="Uber Trip", normalized_merchant="Uber Trip")
+        )
+        hits = self.categorizer._lookup.cache_info().hits
+        
+        second = self.categorizer.categorize(
+            TransactionRecord(id='2', payee="Uber Trip", normalized_merchant="Uber Trip")
+        )
+        
+        self.assertEqual(self.categorizer._lookup.cache_info().hits, hits + 1)
+        self.assertEqual((second.category, second.subcategory), (first.category, first.subcategory))
+    
+    def test_changing_fuzzy_threshold_invalidates_cache(self):
+        """Test that memoized matches do not outlive a threshold change."""
+        categorizer = Categorizer(fuzzy_threshold=67)
+        record = TransactionRecord(id='1', payee="cab", normalized_merchant="cab")
+        self.assertEqual(categorizer.categorize(record).subcategory, 'Restaurants')
+        
+        categorizer.fuzzy_threshold = 80
+        result = categorizer.categorize(TransactionRecord(id='2', payee="cab", normalized_merchant="cab"))
+        _, subcategories, _ = categorizer.categorize_columns(["cab"])
+        
+        self.assertEqual(result.subcategory, 'Ride Share')
+        self.assertEqual(subcategories, ['Ride Share'])
+    
     def test_category_statistics(self):
         """Test generation of category statistics."""
         records = [
@@ -302,6 +447,20 @@ class TestCategorizer(unittest.TestCase):
                 self.assertEqual(result.category, expected_category)
                 self.assertEqual(result.subcategory, expected_subcategory)
     
+    def test_arabic_merchant_unicode_variants(self):
+        """Test that Arabic harakat and presentation forms match plain keywords."""
+        test_cases = [
+            "مَطْعَم المدينة",  # With harakat
+            "\ufee3\ufec4\ufecc\ufee2 المدينة",  # Presentation forms of مطعم
+        ]
+        
+        for merchant in test_cases:
+            with self.subTest(merchant=merchant):
+                record = TransactionRecord(id='test-arabic-variant', payee=merchant, normalized_merchant=merchant)
+                result = self.categorizer.categorize(record)
+                self.assertEqual(result.category, 'Food & Dining')
+                self.assertEqual(result.subcategory, 'Restaurants')
+    
     def test_mixed_language_merchant(self):
         """Test categorization with mixed English/Arabic names."""
         record = TransactionRecord(
@@ -387,6 +546,43 @@ fallback:
             # Clean up
             Path(temp_file).unlink()
     
+    def test_rules_file_reparsed_after_change(self):
+        """Test that cached rules are reused per instance and refreshed on file change."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            rules_file = Path(temp_dir) / 'rules.yaml'
+            rules_file.write_text(
+                'categories:\n  - category: "First"\n    subcategory: "A"\n', encoding='utf-8'
+            )
+            
+            first = Categorizer(rules_path=str(rules_file))
+            first.rules['categories'][0]['category'] = 'Mutated'
+            second = Categorizer(rules_path=str(rules_file))
+            self.assertEqual(second.rules['categories'][0]['category'], 'First')
+            
+            rules_file.write_text(
+                'categories:\n  - category: "Second"\n    subcategory: "B"\n', encoding='utf-8'
+            )
+            third = Categorizer(rules_path=str(rules_file))
+            self.assertEqual(third.rules['categories'][0]['category'], 'Second')
+    
+    def test_rules_file_reparsed_after_change_keeping_mtime_and_size(self):
+        """Test that an edit within the timestamp granularity is not served stale."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            rules_file = Path(temp_dir) / 'rules.yaml'
+            rules_file.write_text(
+                'categories:\n  - category: "Alpha"\n    subcategory: "A"\n', encoding='utf-8'
+            )
+            stat = rules_file.stat()
+            self.assertEqual(Categorizer(rules_path=str(rules_file)).rules['categories'][0]['category'], 'Alpha')
+            
+            rules_file.write_text(
+                'categories:\n  - category: "Omega"\n    subcategory: "A"\n', encoding='utf-8'
+            )
+            os.utime(rules_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            
+            categorizer = Categorizer(rules_path=str(rules_file))
+            self.assertEqual(categorizer.rules['categories'][0]['category'], 'Omega')
+    
     def test_json_rules_file(self):
         """Test loading rules from JSON file."""
         # Create a temporary JSON rules file
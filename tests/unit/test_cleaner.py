@@ -8,15 +8,29 @@ from goldminer.etl import DataCleaner
 class TestDataCleaner(unittest.TestCase):
     """Test cases for DataCleaner class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.cleaner = DataCleaner()
+    @classmethod
+    def setUpClass(cls):
+        """Build the cleaner and the sample frames once for the whole class."""
+        # DataCleaner holds no per-call state, so one instance serves all tests
+        cls.cleaner = DataCleaner()
         
-        # Create sample DataFrame with duplicates
-        self.df = pd.DataFrame({
+        # Sample DataFrame with duplicates
+        cls.base_df = pd.DataFrame({
             'col1': [1, 2, 2, 3, 4],
             'col2': ['a', 'b', 'b', 'c', 'd']
         })
+        
+        # Sample DataFrame with a missing value
+        cls.nulls_df = pd.DataFrame({
+            'col1': [1, 2, None, 4],
+            'col2': ['a', 'b', 'c', 'd']
+        })
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        # Copying a built frame is much cheaper than constructing one from a
+        # dict, and keeps each test's frame independent
+        self.df = self.base_df.copy()
     
     def test_remove_duplicates(self):
         """Test duplicate removal."""
@@ -30,10 +44,7 @@ class TestDataCleaner(unittest.TestCase):
     
     def test_handle_missing_values_drop(self):
         """Test handling missing values with drop strategy."""
-        df_nulls = pd.DataFrame({
-            'col1': [1, 2, None, 4],
-            'col2': ['a', 'b', 'c', 'd']
-        })
+        df_nulls = self.nulls_df.copy()
         
         df_clean = self.cleaner.handle_missing_values(df_nulls, strategy='drop')
         
@@ -42,10 +53,7 @@ class TestDataCleaner(unittest.TestCase):
     
     def test_handle_missing_values_fill(self):
         """Test handling missing values with fill strategy."""
-        df_nulls = pd.DataFrame({
-            'col1': [1, 2, None, 4],
-            'col2': ['a', 'b', 'c', 'd']
-        })
+        df_nulls = self.nulls_df.copy()
         
         df_clean = self.cleaner.handle_missing_values(
             df_nulls, 
@@ -1,6 +1,7 @@
 """Unit tests for configuration management."""
 import unittest
 import tempfile
+import shutil
 import os
 from goldminer.config import ConfigManager
 
@@ -8,16 +9,16 @@ from goldminer.config import ConfigManager
 class TestConfigManager(unittest.TestCase):
     """Test cases for ConfigManager class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_path = os.path.join(self.temp_dir, 'test_config.yaml')
+    @classmethod
+    def setUpClass(cls):
+        """Create one temp directory for the class; only saving writes to it."""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.config_path = os.path.join(cls.temp_dir, 'test_config.yaml')
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test fixtures."""
-        if os.path.exists(self.config_path):
-            os.remove(self.config_path)
-        os.rmdir(self.temp_dir)
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
     
     def test_default_config_loading(self):
         """Test loading default configuration."""
@@ -44,6 +45,7 @@ class TestConfigManager(unittest.TestCase):
         """Test saving and loading configuration."""
         config = ConfigManager(config_path=self.config_path)
         config.save_config()
+        self.addCleanup(os.remove, self.config_path)
         
         # Check file was created
         self.assertTrue(os.path.exists(self.config_path))
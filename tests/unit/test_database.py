@@ -1,7 +1,8 @@
 """Unit tests for database management."""
-import unittest
-import tempfile
 import os
+import sqlite3
+import tempfile
+import unittest
 import pandas as pd
 from goldminer.etl import DatabaseManager
 
@@ -11,8 +12,9 @@ class TestDatabaseManager(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, 'test.db')
+        # Each connection to ":memory:" opens its own empty database, so tests
+        # stay isolated without touching the filesystem
+        self.db_path = ':memory:'
         self.db_manager = DatabaseManager(self.db_path)
         
         # Create sample DataFrame
@@ -24,9 +26,6 @@ class TestDatabaseManager(unittest.TestCase):
     def tearDown(self):
         """Clean up test fixtures."""
         self.db_manager.disconnect()
-        if os.path.exists(self.db_path):
-            os.remove(self.db_path)
-        os.rmdir(self.temp_dir)
     
     def test_connect_disconnect(self):
         """Test database connection and disconnection."""
@@ -63,6 +62,17 @@ class TestDatabaseManager(unittest.TestCase):
         self.assertIn('table1', tables)
         self.assertIn('table2', tables)
     
+    def test_list_tables_sees_schema_changes(self):
+        """Test that cached table names follow tables created or dropped by SQL."""
+        self.db_manager.save_dataframe(self.df, 'table1')
+        self.assertEqual(self.db_manager.list_tables(), ['table1'])
+        
+        self.db_manager.execute_query("CREATE TABLE table2 (col1 INTEGER)")
+        self.assertEqual(self.db_manager.list_tables(), ['table1', 'table2'])
+        
+        self.db_manager.execute_query("DROP TABLE table1")
+        self.assertEqual(self.db_manager.list_tables(), ['table2'])
+    
     def test_get_table_info(self):
         """Test getting table information."""
         self.db_manager.save_dataframe(self.df, 'test_table')
@@ -82,6 +92,34 @@ class TestDatabaseManager(unittest.TestCase):
         tables = self.db_manager.list_tables()
         self.assertNotIn('test_table', tables)
     
+    def test_managers_do_not_share_connection_state(self):
+        """Test that a new manager does not inherit a previous one's connection."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        db_path = os.path.join(temp_dir.name, 'state.db')
+        
+        with DatabaseManager(db_path) as db:
+            db.save_dataframe(self.df, 'test_table')
+            db.connection.row_factory = sqlite3.Row
+            db.connection.execute("CREATE TEMP TABLE scratch (x INTEGER)")
+        
+        with DatabaseManager(db_path) as db:
+            self.assertIsNone(db.connection.row_factory)
+            self.assertIsInstance(db.execute_query("SELECT * FROM test_table LIMIT 1")[0], tuple)
+            self.assertNotIn('scratch', [row[0] for row in db.connection.execute(
+                "SELECT name FROM sqlite_temp_master WHERE type = 'table'"
+            )])
+    
+    def test_disconnect_after_connection_closed(self):
+        """Test that disconnecting a manager whose connection was closed is a no-op."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        
+        with DatabaseManager(os.path.join(temp_dir.name, 'closed.db')) as db:
+            db.connection.close()
+            db.disconnect()
+            self.assertIsNone(db.connection)
+    
     def test_context_manager(self):
         """Test using DatabaseManager as context manager."""
         with DatabaseManager(self.db_path) as db:
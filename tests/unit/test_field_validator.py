@@ -1,7 +1,7 @@
 """Unit tests for FieldValidator and ParsedTransaction."""
 import unittest
 from datetime import datetime
-from goldminer.etl import FieldValidator, ParsedTransaction
+from goldminer.etl import FieldValidator, ParsedTransaction, WarningFlag
 
 
 class TestParsedTransaction(unittest.TestCase):
@@ -189,6 +189,30 @@ class TestParsedTransaction(unittest.TestCase):
         self.assertTrue(any('Missing required field: amount' in w for w in transaction.warnings))
         self.assertEqual(transaction.confidence, 'low')
     
+    def test_warning_flags(self):
+        """Test that warning kinds can be checked without matching messages."""
+        data = {
+            'currency': 'XYZ',
+            'date': 'invalid_date',
+            'card_suffix': '12'
+        }
+    
+        transaction = ParsedTransaction(**data)
+    
+        self.assertEqual(
+            transaction.warning_flags,
+            WarningFlag.AMOUNT_MISSING | WarningFlag.CURRENCY_INVALID
+            | WarningFlag.DATE_MALFORMED | WarningFlag.CARD_SUFFIX_INVALID
+        )
+        self.assertTrue(transaction.has_warning(WarningFlag.DATE_MALFORMED))
+        self.assertFalse(transaction.has_warning(
+            WarningFlag.AMOUNT_INVALID | WarningFlag.CURRENCY_MISSING
+        ))
+    
+        # Warnings passed in that are not validator messages have no flag
+        transaction = ParsedTransaction(warnings=['Parsed from a partial SMS'])
+        self.assertEqual(transaction.warning_flags, WarningFlag(0))
+    
     def test_missing_currency(self):
         """Test transaction with missing currency field."""
         data = {
@@ -348,9 +372,11 @@ class TestParsedTransaction(unittest.TestCase):
 class TestFieldValidator(unittest.TestCase):
     """Test cases for FieldValidator class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.validator = FieldValidator()
+    @classmethod
+    def setUpClass(cls):
+        """Build one validator for the whole class."""
+        # Validation results are copies, so tests cannot see each other's changes
+        cls.validator = FieldValidator()
     
     def test_validate_valid_data(self):
         """Test validation of valid transaction data."""
@@ -510,6 +536,20 @@ class TestFieldValidator(unittest.TestCase):
         results = self.validator.validate_batch([])
         
         self.assertEqual(len(results), 0)
+
+    def test_validate_repeated_input_returns_independent_copies(self):
+        """Test that memoized results are not shared between calls."""
+        data = {'amount': 'abc', 'currency': 'EGP', 'date': '15/11/2024'}
+    
+        first = self.validator.validate(data)
+        first.warnings.append('Changed by caller')
+        first.payee = 'Changed by caller'
+        second = self.validator.validate(data)
+    
+        self.assertIsNot(second, first)
+        self.assertEqual(second.warnings, ['Invalid numeric format for amount: abc'])
+        self.assertIsNone(second.payee)
+        self.assertEqual(second.confidence, 'low')
     
     def test_validate_with_transaction_type_alias(self):
         """Test validation handles transaction_type field name."""
@@ -610,9 +650,11 @@ class TestFieldValidator(unittest.TestCase):
 class TestFieldValidatorEdgeCases(unittest.TestCase):
     """Test edge cases for FieldValidator."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.validator = FieldValidator()
+    @classmethod
+    def setUpClass(cls):
+        """Build one validator for the whole class."""
+        # Validation results are copies, so tests cannot see each other's changes
+        cls.validator = FieldValidator()
     
     def test_unicode_characters_in_payee(self):
         """Test handling of Unicode characters in payee field."""